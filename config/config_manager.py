@@ -22,7 +22,8 @@ DEFAULT_CONFIG = {
         "select_border_color": "orange",
         "placeholder_color": "black",
         "statusbar_font": "Arial",
-        "statusbar_font_size": 10
+        "statusbar_font_size": 10,
+        "hover_settle_ms": 150  # hover dwell before status/info panels/prefetch update
     },
     "hotkeys": {
         "escape_picture_view": {
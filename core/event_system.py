@@ -1,5 +1,5 @@
 from PySide6.QtCore import QObject, QPointF
-from typing import Dict, List, Callable, Optional, Set, FrozenSet
+from typing import Dict, List, Callable, Optional, Set, FrozenSet, Tuple
 from dataclasses import dataclass, field
 from collections import deque
 from enum import Enum
@@ -166,33 +166,38 @@ _EPHEMERAL_EVENT_TYPES: frozenset = frozenset({EventType.INSPECTOR_UPDATE, Event
 class EventSystem(QObject):
     def __init__(self):
         super().__init__()
-        self._subscribers: Dict[EventType, List[Callable]] = {}
+        # why: tuples are replaced, never mutated, so publish can read a
+        # consistent snapshot without copying (or, for ephemeral events, locking).
+        self._subscribers: Dict[EventType, Tuple[Callable, ...]] = {}
         self._event_history: deque[EventData] = deque(maxlen=500)
         self._lock = threading.Lock()
 
     def subscribe(self, event_type: EventType, callback: Callable[[EventData], None]):
         with self._lock:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
-            self._subscribers[event_type].append(callback)
+            self._subscribers[event_type] = self._subscribers.get(event_type, ()) + (callback,)
         logging.debug(f"Subscribed to {event_type.value}: {callback.__name__}")
 
     def unsubscribe(self, event_type: EventType, callback: Callable[[EventData], None]):
         with self._lock:
             if event_type in self._subscribers:
+                callbacks = list(self._subscribers[event_type])
                 try:
-                    self._subscribers[event_type].remove(callback)
+                    callbacks.remove(callback)
+                    self._subscribers[event_type] = tuple(callbacks)
                     logging.debug(f"Unsubscribed from {event_type.value}: {callback.__name__}")
                 except ValueError:
                     logging.warning(f"Callback not found for {event_type.value}")
 
     def publish(self, event_data: EventData):
-        with self._lock:
-            event_type = event_data.event_type
-            if event_type not in _EPHEMERAL_EVENT_TYPES:
+        event_type = event_data.event_type
+        if event_type in _EPHEMERAL_EVENT_TYPES:
+            # Not recorded in history, so a plain dict read of the immutable
+            # subscriber tuple is all that is needed; skip the lock.
+            callbacks = self._subscribers.get(event_type, ())
+        else:
+            with self._lock:
                 self._event_history.append(event_data)
-            # Snapshot the subscriber list so callbacks can safely call subscribe/unsubscribe.
-            callbacks = list(self._subscribers.get(event_type, []))
+                callbacks = self._subscribers.get(event_type, ())
 
         for callback in callbacks:
             try:
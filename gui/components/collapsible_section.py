@@ -21,6 +21,7 @@ class CollapsibleSection(QWidget):
     def __init__(self, title: str, parent=None):
         super().__init__(parent)
         self._collapsed = False
+        self._title = title
         self.setStyleSheet(f"background: {_BG};")
 
         layout = QVBoxLayout(self)
@@ -73,6 +74,12 @@ class CollapsibleSection(QWidget):
     def _on_header_clicked(self, event):
         self.set_collapsed(not self._collapsed)
 
+    def set_title(self, title: str):
+        """Update the header text without rebuilding the section."""
+        if title != self._title:
+            self._title = title
+            self._title_label.setText(title.upper())
+
     def set_collapsed(self, collapsed: bool):
         self._collapsed = collapsed
         self._body.setVisible(not collapsed)
@@ -1,13 +1,46 @@
-from PySide6.QtGui import QKeySequence, QShortcut, QKeyEvent
+from PySide6.QtGui import QKeySequence, QAction, QActionGroup
 import logging
+import sys
 import time
 from PySide6.QtWidgets import QApplication, QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QSpinBox
-from PySide6.QtCore import Qt, QObject, QKeyCombination
+from PySide6.QtCore import Qt, QObject, QEvent
 from config.hotkeys import HotkeyDefinition
 from typing import Dict, List, Callable
 from core.event_system import event_system, EventType, EventData, ZoomEventData
 
+logger = logging.getLogger(__name__)
+
 _TEXT_INPUT_TYPES = (QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QSpinBox)
+_SOURCE = "hotkey_manager"
+_RANGE_ACTION = sys.intern("start_range_selection")
+
+
+def _route_key(key: int, modifiers: int) -> int:
+	"""Pack a key code and modifier bits into one int for the release routing table."""
+	# why: key codes fit in 32 bits, so shifting keeps them clear of the modifier flags
+	return (key << 32) | modifiers
+
+
+def _make_publisher(event_type: EventType) -> Callable[[], None]:
+	"""Return a no-arg action that publishes a payload-free event of event_type."""
+	# why: closure cells are cheaper than global + attribute lookups per keypress.
+	# Each call still builds a fresh event: these types are kept in the event
+	# history, so a reused object would make every entry show the last timestamp.
+	publish, now = event_system.publish, time.time
+
+	def _publish():
+		publish(EventData(event_type=event_type, source=_SOURCE, timestamp=now()))
+	return _publish
+
+
+def _make_zoom_publisher(event_type: EventType, zoom_factor: float = 1.25) -> Callable[[], None]:
+	"""Return a no-arg action that publishes a ZoomEventData of event_type."""
+	publish, now = event_system.publish, time.time
+
+	def _publish():
+		publish(ZoomEventData(event_type=event_type, source=_SOURCE, timestamp=now(),
+							  zoom_factor=zoom_factor))
+	return _publish
 
 
 class HotkeyManager(QObject):
@@ -15,96 +48,96 @@ class HotkeyManager(QObject):
 		super().__init__()
 		self.setParent(parent_widget)
 		self.parent_widget = parent_widget
-		self.shortcuts: Dict[str, List[QShortcut]] = {}
+		self.shortcuts: Dict[str, List[QAction]] = {}
 		self.definitions: Dict[str, HotkeyDefinition] = {}
 		self.actions: Dict[str, Callable] = {}
-		
+		# why: one group holds every hotkey action so suppression is a single setEnabled call
+		self._action_group = QActionGroup(self)
+		self._action_group.setExclusionPolicy(QActionGroup.ExclusionPolicy.None_)
+		self._text_input_types = frozenset(_TEXT_INPUT_TYPES)
+		# Hot callables bound once; handlers below avoid global + attribute lookups.
+		self._publish = event_system.publish
+		self._now = time.time
+
 		self._shortcuts_suppressed = False
+		# why: only the release half of start_range_selection needs a filter;
+		# comparing the cached type member rejects everything else cheaply.
+		self._KEY_RELEASE = QEvent.Type.KeyRelease
+		self._app = QApplication.instance()
+		# True while the app-wide release filter is installed for an active range.
+		self._awaiting_release = False
+		# Key-release handlers for actions with press/release semantics, keyed by _route_key.
+		self._release_routes: Dict[int, Callable[[], None]] = {}
+		# why: keypad/group-switch bits vary with the physical key, never with the binding
+		self._mod_mask = (Qt.ShiftModifier | Qt.ControlModifier | Qt.AltModifier | Qt.MetaModifier).value
 		self._setup_built_in_action_handlers()
 		self.load_config(hotkeys_config)
-		app = QApplication.instance()
+		app = self._app
 		if app:
-			app.installEventFilter(self)
 			app.focusChanged.connect(self._on_focus_changed)
 		else:
-			logging.warning("HotkeyManager: QApplication instance not found, falling back to parent widget for event filter.")
-			parent_widget.installEventFilter(self)
-		
+			logger.warning("HotkeyManager: QApplication instance not found, shortcuts will not be suppressed in text inputs.")
+
 	def _setup_built_in_action_handlers(self):
-		self.add_action("escape_picture_view", lambda: event_system.publish(EventData(event_type=EventType.ESCAPE_PRESSED, source="hotkey_manager", timestamp=time.time())))
-		self.add_action("zoom_in", self._handle_zoom_in)
-		self.add_action("zoom_out", self._handle_zoom_out)
-		self.add_action("next_image", lambda: event_system.publish(EventData(event_type=EventType.NAVIGATE_NEXT, source="hotkey_manager", timestamp=time.time())))
-		self.add_action("previous_image", lambda: event_system.publish(EventData(event_type=EventType.NAVIGATE_PREVIOUS, source="hotkey_manager", timestamp=time.time())))
-		self.add_action("toggle_inspector", lambda: event_system.publish(EventData(event_type=EventType.TOGGLE_INSPECTOR, source="hotkey_manager", timestamp=time.time())))
-		self.add_action("open_filter", lambda: event_system.publish(EventData(event_type=EventType.OPEN_FILTER, source="hotkey_manager", timestamp=time.time())))
-		self.add_action("open_tag_editor", lambda: event_system.publish(EventData(event_type=EventType.OPEN_TAG_EDITOR, source="hotkey_manager", timestamp=time.time())))
-		self.add_action("start_range_selection", self.handle_range_selection_start)
+		self.add_action("escape_picture_view", _make_publisher(EventType.ESCAPE_PRESSED))
+		self.add_action("zoom_in", _make_zoom_publisher(EventType.ZOOM_IN))
+		self.add_action("zoom_out", _make_zoom_publisher(EventType.ZOOM_OUT))
+		self.add_action("next_image", _make_publisher(EventType.NAVIGATE_NEXT))
+		self.add_action("previous_image", _make_publisher(EventType.NAVIGATE_PREVIOUS))
+		self.add_action("toggle_inspector", _make_publisher(EventType.TOGGLE_INSPECTOR))
+		self.add_action("open_filter", _make_publisher(EventType.OPEN_FILTER))
+		self.add_action("open_tag_editor", _make_publisher(EventType.OPEN_TAG_EDITOR))
+		self.add_action(_RANGE_ACTION, self.handle_range_selection_start)
 		self.add_action("pin_inspector", lambda: None)  # placeholder; main_window overrides
 		self.add_action("show_hotkey_help", lambda: None)  # placeholder; main_window overrides
 		self.add_action("toggle_info_panel", lambda: None)  # placeholder; main_window overrides
 
-	def _handle_zoom_in(self):
-		logging.debug("Zoom in triggered")
-		event_system.publish(ZoomEventData(
-			event_type=EventType.ZOOM_IN,
-			source="hotkey_manager",
-			timestamp=time.time(),
-			zoom_factor=1.25,
-		))
-
-	def _handle_zoom_out(self):
-		logging.debug("Zoom out triggered")
-		event_system.publish(ZoomEventData(
-			event_type=EventType.ZOOM_OUT,
-			source="hotkey_manager",
-			timestamp=time.time(),
-			zoom_factor=1.25,
-		))
-
 	def _on_focus_changed(self, old, new):
 		"""Suppress shortcuts while a text-input widget has focus."""
-		should_suppress = isinstance(new, _TEXT_INPUT_TYPES)
+		# why: exact-type set hit covers the usual unsubclassed inputs; isinstance
+		# is only the fallback for subclasses.
+		should_suppress = type(new) in self._text_input_types or isinstance(new, _TEXT_INPUT_TYPES)
 		if should_suppress == self._shortcuts_suppressed:
 			return
 		self._shortcuts_suppressed = should_suppress
-		for shortcut_list in self.shortcuts.values():
-			for shortcut in shortcut_list:
-				shortcut.setEnabled(not should_suppress)
-		logging.debug(f"HotkeyManager: shortcuts {'suppressed' if should_suppress else 'restored'} (focus → {type(new).__name__})")
+		self._action_group.setEnabled(not should_suppress)
+		if logger.isEnabledFor(logging.DEBUG):
+			logger.debug("HotkeyManager: shortcuts %s (focus → %s)",
+						 "suppressed" if should_suppress else "restored", type(new).__name__)
 
 	def handle_range_selection_start(self):
-		event_system.publish(EventData(event_type=EventType.RANGE_SELECTION_START, source="hotkey_manager", timestamp=time.time()))
+		self._publish(EventData(event_type=EventType.RANGE_SELECTION_START,
+								source=_SOURCE, timestamp=self._now()))
+		# why: the press shortcut is application-wide, so the release can land in
+		# any window or child widget. The app-level filter is only installed for
+		# the duration of the hold, so it costs nothing the rest of the time.
+		if self._app and not self._awaiting_release:
+			self._app.installEventFilter(self)
+			self._awaiting_release = True
 
 	def handle_range_selection_end(self):
-		event_system.publish(EventData(event_type=EventType.RANGE_SELECTION_END, source="hotkey_manager", timestamp=time.time()))
+		if self._awaiting_release:
+			self._app.removeEventFilter(self)
+			self._awaiting_release = False
+		self._publish(EventData(event_type=EventType.RANGE_SELECTION_END,
+								source=_SOURCE, timestamp=self._now()))
 
 	def eventFilter(self, obj, event):
-		if not isinstance(event, QKeyEvent):
-			return super().eventFilter(obj, event)
-
-		if self._shortcuts_suppressed:
-			return super().eventFilter(obj, event)
-
-		range_select_def = self.definitions.get("start_range_selection")
-		if not (range_select_def and range_select_def.sequences):
-			return super().eventFilter(obj, event)
-
-		key_seq = QKeySequence(range_select_def.sequences[0])
-		target_combination = key_seq[0]
-		event_combination = QKeyCombination(event.modifiers(), Qt.Key(event.key()))
-		if event_combination == target_combination:
-			if event.type() == QKeyEvent.Type.KeyPress:
-				if not event.isAutoRepeat():
-					self.handle_range_selection_start()
-				return True
-			elif event.type() == QKeyEvent.Type.KeyRelease:
-				if not event.isAutoRepeat():
-					self.handle_range_selection_end()
-				return True
-					
-		return super().eventFilter(obj, event)
-						
+		"""Detect the key release that ends a hotkey range selection.
+
+		The press side is an ordinary QAction shortcut; see add_hotkey_shortcut.
+		"""
+		if event.type() != self._KEY_RELEASE or self._shortcuts_suppressed:
+			return False
+
+		on_release = self._release_routes.get(
+			_route_key(event.key(), event.modifiers().value & self._mod_mask))
+		if on_release is None:
+			return False
+		if not event.isAutoRepeat():
+			on_release()
+		return True
+
 	def load_config(self, config: dict):
 		for action_name, action_config in config.items():
 			try:
@@ -123,43 +156,55 @@ class HotkeyManager(QObject):
 				self.add_hotkey_shortcut(definition)
 			except Exception as e:
 				# why: skip malformed config entries without aborting the whole load
-				logging.error(f"Error loading hotkey config for {action_name}: {e}")
+				logger.error("Error loading hotkey config for %s: %s", action_name, e)
 
 	def add_hotkey_shortcut(self, definition: HotkeyDefinition):
 		if not definition.sequences:
 			return
 			
-		# This action is handled exclusively by the eventFilter for press/release logic
-		if definition.action_name == "start_range_selection":
-			logging.debug("Skipping QShortcut for 'start_range_selection', handled by eventFilter.")
-			self.definitions[definition.action_name] = definition
-			return
-
-		logging.debug(f"Setting up hotkey: {definition.action_name} ({definition.sequences})")
-		
-		self.definitions[definition.action_name] = definition
-		self.shortcuts[definition.action_name] = []
-		
-		for sequence in definition.sequences:
-			shortcut = QShortcut(QKeySequence(sequence), self.parent_widget)
-			shortcut.setContext(Qt.ApplicationShortcut)
-			shortcut.activated.connect(
-				lambda an=definition.action_name: self.on_shortcut_triggered(an)
-			)
-			self.shortcuts[definition.action_name].append(shortcut)
+		# why: interned names let dict lookups in on_shortcut_triggered hit on identity
+		name = sys.intern(definition.action_name)
+
+		# Press goes through the QAction below; release is routed by eventFilter.
+		if name is _RANGE_ACTION:
+			for sequence in definition.sequences:
+				combination = QKeySequence(sequence)[0]
+				key = _route_key(combination.key().value,
+								 combination.keyboardModifiers().value & self._mod_mask)
+				self._release_routes[key] = self.handle_range_selection_end
+
+		if logger.isEnabledFor(logging.DEBUG):
+			logger.debug("Setting up hotkey: %s (%s)", name, definition.sequences)
+
+		self.definitions[name] = definition
+
+		action = QAction(definition.description or name, self.parent_widget)
+		action.setShortcuts([QKeySequence(sequence) for sequence in definition.sequences])
+		action.setShortcutContext(Qt.ApplicationShortcut)
+		if name is _RANGE_ACTION:
+			action.setAutoRepeat(False)
+		action.triggered.connect(
+			lambda _checked=False, an=name: self.on_shortcut_triggered(an)
+		)
+		self._action_group.addAction(action)
+		self.parent_widget.addAction(action)
+		self.shortcuts[name] = [action]
 
 	def add_action(self, action_name: str, callback: Callable):
-		self.actions[action_name] = callback
-		logging.debug(f"Registered action '{action_name}' with callback {callback}")
+		self.actions[sys.intern(action_name)] = callback
+		if logger.isEnabledFor(logging.DEBUG):
+			logger.debug("Registered action '%s' with callback %s", action_name, callback)
 
 	def on_shortcut_triggered(self, action_name: str):
-		logging.debug(f"HotkeyManager.on_shortcut_triggered: '{action_name}' (shortcuts enabled: {any(s.isEnabled() for sl in self.shortcuts.values() for s in sl)})")
+		if logger.isEnabledFor(logging.DEBUG):
+			logger.debug("HotkeyManager.on_shortcut_triggered: '%s' (shortcuts enabled: %s)",
+						 action_name, self._action_group.isEnabled())
 		handler = self.actions.get(action_name)
 		if handler:
 			try:
 				handler()
 			except Exception as e:
 				# why: isolate handler crashes so one broken action can't break other shortcuts
-				logging.error(f"Error executing action {action_name}: {e}")
+				logger.error("Error executing action %s: %s", action_name, e)
 		else:
-			logging.error(f"No handler found for action: {action_name}")
+			logger.error("No handler found for action: %s", action_name)
@@ -1,13 +1,31 @@
+import functools
+import os
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List, Tuple
 
 
-@dataclass
+@functools.lru_cache(maxsize=4096)
+def cached_basename(path: str) -> str:
+    """os.path.basename, memoized for the hover path."""
+    return os.path.basename(path)
+
+
+@dataclass(slots=True, frozen=True)
 class Section:
-    """A named group of key-value pairs for display."""
+    """A named group of key-value pairs for display.
+
+    Immutable and hashable; rows given as a list are stored as a tuple.
+    ``key`` identifies the section across refreshes so the panel can reuse
+    its widget when the title changes; empty means "use the title".
+    """
     title: str
-    rows: List[Tuple[str, str]] = field(default_factory=list)
+    rows: Tuple[Tuple[str, str], ...] = ()
+    key: str = ""
+
+    def __post_init__(self):
+        if type(self.rows) is not tuple:
+            object.__setattr__(self, "rows", tuple(self.rows))
 
 
 class ContentProvider(ABC):
@@ -1,10 +1,10 @@
 from typing import Optional
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QPushButton, QHBoxLayout, QLabel
-from PySide6.QtCore import Qt, Signal, QSettings
+from PySide6.QtCore import Qt, Signal, QSettings, QThreadPool
 from PySide6.QtGui import QFont
 
-from .content_provider import ContentProvider
+from .content_provider import ContentProvider, cached_basename
 from ..components.collapsible_section import CollapsibleSection
 
 # Palette — mirrors HotkeyHelpOverlay
@@ -20,6 +20,14 @@ _FONT = "monospace"
 _FONT_SIZE = 12
 
 
+def _write_geometry(panel_index: int, geometry) -> None:
+    """Persist a panel's geometry; safe to run off the GUI thread."""
+    # why: QSettings is reentrant, so a private instance may be used from a pool thread.
+    settings = QSettings("RabbitViewer", "InfoPanel")
+    settings.setValue(f"geometry_{panel_index}", geometry)
+    settings.sync()
+
+
 class InfoPanelShell(QWidget):
     """Top-level window displaying structured info for the hovered/pinned image."""
 
@@ -36,8 +44,14 @@ class InfoPanelShell(QWidget):
         self._pinned = False
         self._pinned_path: Optional[str] = None
         self._current_path: Optional[str] = None
+        # Keyed by Section.key (falling back to title) so renames reuse widgets.
         self._sections: dict[str, CollapsibleSection] = {}
         self._collapsed_state: dict[str, bool] = {}
+        # Hashes of the last rendered provider output, to skip no-op refreshes.
+        self._last_sections_fingerprint: Optional[int] = None
+        self._section_row_fp: dict[str, int] = {}
+        # Set when a refresh was skipped while hidden; replayed in showEvent.
+        self._dirty = False
 
         self.setWindowTitle(f"Info: {provider.provider_name}")
         self.setMinimumSize(280, 200)
@@ -152,6 +166,8 @@ class InfoPanelShell(QWidget):
     # -- Public API (called by MainWindow) --
 
     def on_thumbnail_hovered(self, path: str):
+        # why: MainWindow only forwards hovers once they have settled, so a
+        # second debounce here would just add latency.
         if self._pinned:
             return
         self._update_for_path(path)
@@ -172,38 +188,54 @@ class InfoPanelShell(QWidget):
         if not path or path == self._current_path:
             return
         self._current_path = path
-        self._path_label.setText(path.rsplit("/", 1)[-1])
+        self._path_label.setText(cached_basename(path))
         self._refresh_sections()
 
     def _refresh_sections(self):
         if not self._current_path:
             return
+        if not self.isVisible():
+            # why: nobody can see the result; defer provider + widget work to showEvent
+            self._dirty = True
+            return
+        self._dirty = False
 
         sections = self._provider.get_sections(self._current_path)
-        new_titles = {s.title for s in sections}
+        fp = hash(tuple(sections))
+        if fp == self._last_sections_fingerprint:
+            return
+        self._last_sections_fingerprint = fp
+        new_keys = {s.key or s.title for s in sections}
 
         # Remove stale
-        for title in list(self._sections.keys()):
-            if title not in new_titles:
-                widget = self._sections.pop(title)
-                self._scroll_layout.removeWidget(widget)
-                widget.deleteLater()
+        for key in self._sections.keys() - new_keys:
+            widget = self._sections.pop(key)
+            self._section_row_fp.pop(key, None)
+            self._scroll_layout.removeWidget(widget)
+            widget.deleteLater()
 
         # Update or create
         insert_idx = 0
         for section_data in sections:
-            if section_data.title in self._sections:
-                self._sections[section_data.title].set_rows(section_data.rows)
+            key = section_data.key or section_data.title
+            row_fp = hash(section_data.rows)
+            widget = self._sections.get(key)
+            if widget is not None:
+                widget.set_title(section_data.title)
+                if self._section_row_fp.get(key) != row_fp:
+                    widget.set_rows(section_data.rows)
+                    self._section_row_fp[key] = row_fp
             else:
                 widget = CollapsibleSection(section_data.title)
                 widget.set_rows(section_data.rows)
-                if section_data.title in self._collapsed_state:
-                    widget.set_collapsed(self._collapsed_state[section_data.title])
+                self._section_row_fp[key] = row_fp
+                if key in self._collapsed_state:
+                    widget.set_collapsed(self._collapsed_state[key])
                 widget.toggled.connect(
-                    lambda collapsed, t=section_data.title:
-                        self._collapsed_state.__setitem__(t, collapsed)
+                    lambda collapsed, k=key:
+                        self._collapsed_state.__setitem__(k, collapsed)
                 )
-                self._sections[section_data.title] = widget
+                self._sections[key] = widget
                 self._scroll_layout.insertWidget(insert_idx, widget)
             insert_idx += 1
 
@@ -224,10 +256,16 @@ class InfoPanelShell(QWidget):
         else:
             self.setWindowTitle(base)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._dirty:
+            self._refresh_sections()
+
     def closeEvent(self, event):
-        settings = QSettings("RabbitViewer", "InfoPanel")
-        settings.setValue(f"geometry_{self._panel_index}", self.saveGeometry())
-        settings.sync()
+        idx, geometry = self._panel_index, self.saveGeometry()
+        # why: main-window shutdown closes every panel in a row; keep the disk
+        # syncs off the GUI thread.
+        QThreadPool.globalInstance().start(lambda: _write_geometry(idx, geometry))
         self._provider.on_cleanup()
         super().closeEvent(event)
         if event.isAccepted():
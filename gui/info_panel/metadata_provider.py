@@ -1,8 +1,8 @@
-import os
-from datetime import datetime
-from typing import List
+from collections import OrderedDict
+from typing import List, Tuple
 
-from .content_provider import ContentProvider, Section
+from .content_provider import ContentProvider, Section, cached_basename
+from ..metadata_cache import add_display_fields
 
 
 def _has(meta: dict, key: str) -> bool:
@@ -13,32 +13,52 @@ def _has(meta: dict, key: str) -> bool:
 class MetadataProvider(ContentProvider):
     """Formats cached EXIF/file metadata into collapsible sections."""
 
+    SECTION_CACHE_SIZE = 128
+
     def __init__(self, metadata_cache):
         self._cache = metadata_cache
+        # why: hover revisits the same thumbnails constantly; keying on the
+        # cache's per-path version means a metadata write invalidates for free.
+        self._section_cache: OrderedDict[Tuple[str, int], List[Section]] = OrderedDict()
 
     @property
     def provider_name(self) -> str:
         return "Metadata"
 
     def get_sections(self, image_path: str) -> List[Section]:
+        key = (image_path, self._cache.version_for(image_path))
+        hit = self._section_cache.get(key)
+        if hit is not None:
+            self._section_cache.move_to_end(key)
+            return hit
+
+        sections = self._build_sections(image_path)
+        self._section_cache[key] = sections
+        while len(self._section_cache) > self.SECTION_CACHE_SIZE:
+            self._section_cache.popitem(last=False)
+        return sections
+
+    def _build_sections(self, image_path: str) -> List[Section]:
         meta = self._cache.get(image_path)
         if not meta:
-            return [Section("Status", [("", "No metadata cached")])]
+            return [Section("Status", [("", "No metadata cached")], key="status")]
 
         sections = []
 
+        if "_formatted_size" not in meta:
+            # why: entries put through MetadataCache already carry these
+            add_display_fields(meta)
+
         # File info
-        file_rows = [("Filename", os.path.basename(image_path))]
+        file_rows = [("Filename", cached_basename(image_path))]
         w, h = meta.get("width"), meta.get("height")
         if w and h:
             file_rows.append(("Dimensions", f"{w} x {h}"))
-        if meta.get("file_size"):
-            size_mb = meta["file_size"] / (1024 * 1024)
-            file_rows.append(("File Size", f"{size_mb:.1f} MB"))
-        rating = meta.get("rating")
-        if rating:
-            file_rows.append(("Rating", "\u2605" * int(rating)))
-        sections.append(Section("File", file_rows))
+        if meta["_formatted_size"]:
+            file_rows.append(("File Size", meta["_formatted_size"]))
+        if meta["_rating_stars"]:
+            file_rows.append(("Rating", meta["_rating_stars"]))
+        sections.append(Section("File", file_rows, key="file"))
 
         # Camera info
         cam_rows = []
@@ -50,7 +70,7 @@ class MetadataProvider(ContentProvider):
             if _has(meta, key):
                 cam_rows.append((label, str(meta[key])))
         if cam_rows:
-            sections.append(Section("Camera", cam_rows))
+            sections.append(Section("Camera", cam_rows, key="camera"))
 
         # Exposure info
         exp_rows = []
@@ -62,13 +82,9 @@ class MetadataProvider(ContentProvider):
             exp_rows.append(("Shutter Speed", str(meta["shutter_speed"])))
         if _has(meta, "iso"):
             exp_rows.append(("ISO", str(meta["iso"])))
-        if _has(meta, "date_taken"):
-            try:
-                dt_str = datetime.fromtimestamp(float(meta["date_taken"])).strftime("%Y-%m-%d %H:%M:%S")
-            except (ValueError, TypeError, OSError):
-                dt_str = str(meta["date_taken"])
-            exp_rows.append(("Date", dt_str))
+        if meta["_formatted_date"] is not None:
+            exp_rows.append(("Date", meta["_formatted_date"]))
         if exp_rows:
-            sections.append(Section("Exposure", exp_rows))
+            sections.append(Section("Exposure", exp_rows, key="exposure"))
 
         return sections
@@ -1,4 +1,5 @@
-from typing import List
+from collections import defaultdict
+from typing import DefaultDict, List, Tuple
 
 from .content_provider import ContentProvider, Section
 
@@ -7,7 +8,7 @@ class ScriptOutputProvider(ContentProvider):
     """Displays structured output from scripts. Infrastructure TBD."""
 
     def __init__(self):
-        self._last_output: dict = {}
+        self._last_output: DefaultDict[str, List[Tuple[str, str]]] = defaultdict(list)
 
     @property
     def provider_name(self) -> str:
@@ -21,6 +22,4 @@ class ScriptOutputProvider(ContentProvider):
 
     def receive_output(self, image_path: str, key: str, value: str):
         """Accumulator for future ScriptAPI.emit_output()."""
-        if image_path not in self._last_output:
-            self._last_output[image_path] = []
         self._last_output[image_path].append((key, value))
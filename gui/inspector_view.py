@@ -1,26 +1,38 @@
 # gui/inspector_view.py
 
 import enum
+import itertools
 import logging
-import os
+import math
+import queue
 import threading
-from typing import Optional
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Callable, Optional
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt, QPointF, QSettings, QPoint, Signal, Slot
-from PySide6.QtGui import QPainter, QImage
+from PySide6.QtCore import Qt, QObject, QPointF, QSettings, QPoint, QRect, QSize, QThreadPool, QTimer, Signal, Slot
+from PySide6.QtGui import QPainter, QImage, QPixmap, QRegion
 from .picture_base import PictureBase
 from core.event_system import event_system, EventType, InspectorEventData
 from network.daemon_signals import DaemonSignals
 from network.protocol import PreviewsReadyData
 from network.socket_client import ThumbnailSocketClient
-from plugins.video_plugin import VIDEO_EXTENSIONS
+from utils.media_types import is_video
 
-_VIDEO_EXTENSIONS = frozenset(VIDEO_EXTENSIONS)
 
+def _pixmap_bytes(pixmap: QPixmap) -> int:
+    return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
 
-def _is_video(path: str) -> bool:
-    _, ext = os.path.splitext(path)
-    return ext.lower() in _VIDEO_EXTENSIONS
+
+def _write_settings(inspector_index: int, geometry, view_mode: str) -> None:
+    """Persist per-window inspector settings; safe to run off the GUI thread."""
+    # why: QSettings is reentrant, so a private instance may be used from a pool thread.
+    settings = QSettings("RabbitViewer", "Inspector")
+    settings.setValue(f"geometry_{inspector_index}", geometry)
+    settings.setValue(f"view_mode_{inspector_index}", view_mode)
+    settings.sync()
 
 
 class _ViewMode(enum.Enum):
@@ -29,14 +41,220 @@ class _ViewMode(enum.Enum):
     MANUAL = "manual"
 
 
+_MODE_FROM_STR = {m.value: m for m in _ViewMode}
+
+# Wheel zoom factor per net tick count; _apply_wheel_zoom falls back to ** outside it.
+_POW125 = {i: 1.25 ** i for i in range(-20, 21)}
+
+# Frame rate assumed for scrub hysteresis when the container reports none.
+_SCRUB_FALLBACK_FPS = 30
+
+# Int mirrors of _ViewMode for per-event handlers; kept in sync by the
+# InspectorView._view_mode setter.
+_VM_TRACKING, _VM_FIT, _VM_MANUAL = 0, 1, 2
+_VM_INT = {_ViewMode.TRACKING: _VM_TRACKING, _ViewMode.FIT: _VM_FIT, _ViewMode.MANUAL: _VM_MANUAL}
+
+# Window title per (is_video_mode, view_mode); formatted with the zoom factor.
+_TITLES = {
+    (True, _ViewMode.FIT): "Inspector - Video Fit",
+    (True, _ViewMode.MANUAL): "Inspector - Video Scrub (Manual)",
+    (True, _ViewMode.TRACKING): "Inspector - Video Scrub (Tracking)",
+    (False, _ViewMode.FIT): "Inspector - Fit Mode",
+    (False, _ViewMode.MANUAL): "Inspector - Locked ({zoom:.1f}x Zoom)",
+    (False, _ViewMode.TRACKING): "Inspector - Tracking ({zoom:.1f}x Zoom)",
+}
+
+
+@dataclass(slots=True)
+class _PanState:
+    """Per-drag pan bookkeeping read on every mouse move.
+
+    Holds the last cursor position, the screen delta not yet applied, and
+    the inverse view transform's linear part plus padded size; the matrix is
+    valid while ``version`` matches PictureBase.scaleVersion().
+    """
+    last_x: float = 0.0
+    last_y: float = 0.0
+    pending_dx: float = 0.0
+    pending_dy: float = 0.0
+    valid: bool = False
+    version: int = -1
+    m11: float = 1.0
+    m12: float = 0.0
+    m21: float = 0.0
+    m22: float = 1.0
+    padded_w: float = 1.0
+    padded_h: float = 1.0
+
+
+class _StatusBatcher(QObject):
+    """Shared preview-status lookup for every open InspectorView.
+
+    Requests arriving within one short window are sent to the daemon as a
+    single get_previews_status call instead of one round-trip per inspector.
+    """
+
+    # why: 2 ms is well under a frame, yet wide enough to catch the same hover
+    # event fanned out to every inspector by event_system.
+    _BATCH_WINDOW_MS = 2
+
+    # Paths whose view image was reported ready, answered without the socket.
+    # why: the TTL bounds how long a deleted view file can be served stale.
+    _READY_CACHE_MAX = 512
+    _READY_TTL_S = 60.0
+
+    # Delivers background-thread socket results back to the GUI thread.
+    # Arg: {image_path: view_image_path_or_empty}
+    _results_ready = Signal(object)
+
+    _instance: Optional["_StatusBatcher"] = None
+
+    @classmethod
+    def instance(cls) -> "_StatusBatcher":
+        # why: created lazily so the QTimer is built after QApplication exists
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self._pending: dict[ThumbnailSocketClient, dict[str, None]] = {}
+        self._waiters: dict[str, list[Callable[[str, str], None]]] = {}
+        self._ready: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        # why: one long-lived worker serves every batch; no thread churn per
+        # hover and at most one socket fetch in flight for all inspectors.
+        self._batches: queue.SimpleQueue[tuple[ThumbnailSocketClient, list[str]]] = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self._BATCH_WINDOW_MS)
+        self._timer.timeout.connect(self._flush)
+        self._results_ready.connect(self._dispatch)
+
+    def request(self, socket_client: ThumbnailSocketClient, image_path: str,
+                callback: Callable[[str, str], None]) -> None:
+        """Queue image_path; callback(image_path, view_image_path) runs on the GUI thread."""
+        hit = self._ready.get(image_path)
+        if hit is not None:
+            if time.monotonic() - hit[0] < self._READY_TTL_S:
+                self._ready.move_to_end(image_path)
+                callback(image_path, hit[1])
+                return
+            del self._ready[image_path]
+        waiters = self._waiters.get(image_path)
+        if waiters is not None:
+            # Already pending or in flight; piggyback on that result.
+            waiters.append(callback)
+            return
+        self._waiters[image_path] = [callback]
+        self._pending.setdefault(socket_client, {})[image_path] = None
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _flush(self):
+        pending, self._pending = self._pending, {}
+        for socket_client, paths in pending.items():
+            self._batches.put((socket_client, list(paths)))
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run, daemon=True, name="inspector-fetch")
+            self._worker.start()
+
+    def _run(self):
+        while True:
+            socket_client, image_paths = self._batches.get()
+            merged = {socket_client: dict.fromkeys(image_paths)}
+            # why: hovers keep flushing while a fetch is on the wire; fold
+            # everything queued meanwhile into one round-trip per client.
+            while True:
+                try:
+                    socket_client, image_paths = self._batches.get_nowait()
+                except queue.Empty:
+                    break
+                merged.setdefault(socket_client, {}).update(dict.fromkeys(image_paths))
+            for socket_client, paths in merged.items():
+                self._fetch_batch(socket_client, list(paths))
+
+    def _fetch_batch(self, socket_client: ThumbnailSocketClient, image_paths: list[str]):
+        results = dict.fromkeys(image_paths, "")
+        try:
+            response = socket_client.get_previews_status(image_paths)
+            if response and response.status == "success":
+                for image_path in image_paths:
+                    status = response.statuses.get(image_path)
+                    if status and status.view_image_ready and status.view_image_path:
+                        results[image_path] = status.view_image_path
+        except Exception as e:
+            # why: socket calls can raise ConnectionError/OSError/TimeoutError on
+            # NAS drop or pool exhaustion; log and deliver empty paths to unblock GUI.
+            logging.error("Inspector: error fetching preview status for %d paths: %s",
+                          len(image_paths), e)
+            self._results_ready.emit(results)
+            return
+
+        for image_path, view_image_path in results.items():
+            if view_image_path:
+                continue
+            try:
+                # Request generation; result will arrive via previews_ready daemon notification.
+                result = socket_client.request_view_image(image_path)
+                if result and result.status == "success":
+                    if result.view_image_source == "memory":
+                        # Mem-cached — deliver sentinel so main thread fetches bytes.
+                        results[image_path] = "memory"
+                    elif result.view_image_path:
+                        results[image_path] = result.view_image_path
+            except Exception as e:  # why: same socket failure modes as above; isolate per path
+                logging.error("Inspector: error requesting view image for %s: %s", image_path, e)
+
+        self._results_ready.emit(results)
+
+    def invalidate(self, image_path: str) -> None:
+        """Forget a cached ready status, e.g. after the daemon regenerated it."""
+        self._ready.pop(image_path, None)
+
+    @Slot(object)
+    def _dispatch(self, results: dict):
+        now = time.monotonic()
+        # why: pop every waiter list before running any callback, so a callback
+        # that raises cannot leave later paths stuck with stale waiter entries.
+        deliveries = [(image_path, view_image_path, self._waiters.pop(image_path, ()))
+                      for image_path, view_image_path in results.items()]
+        for image_path, view_image_path, _ in deliveries:
+            # "memory" entries can be evicted daemon-side at any time; don't cache.
+            if view_image_path and view_image_path != "memory":
+                self._ready[image_path] = (now, view_image_path)
+                self._ready.move_to_end(image_path)
+                if len(self._ready) > self._READY_CACHE_MAX:
+                    self._ready.popitem(last=False)
+        for image_path, view_image_path, callbacks in deliveries:
+            for callback in callbacks:
+                try:
+                    callback(image_path, view_image_path)
+                except Exception as e:  # why: one failing inspector (e.g. already closed) must not starve the others
+                    logging.error("Inspector: status callback failed for %s: %s", image_path, e)
+
+
 class InspectorView(QWidget):
 
+    # Downscaled copies of the current image, one per zoom level, for zoom < 1.
+    # why: bounded by bytes, not entries; near-1x copies of a 4K view image
+    # are tens of MB each.
+    _SCALED_CACHE_MAX_BYTES = 96 * 1024 * 1024
+
+    # Paths already handed to prefetch_neighbors; bounds repeat requests.
+    _PREFETCH_LRU_MAX = 64
+
+    # GUI-thread QSettings shared by every inspector window; see _settings().
+    _shared_settings: Optional[QSettings] = None
+
+    # Set once importing mpv failed; stops every inspector retrying the import.
+    _mpv_missing = False
+
     closed = Signal()
-    # Delivers background-thread socket results back to the GUI thread.
-    # Args: (image_path, view_image_path_or_empty, normalized_position)
-    _preview_status_ready = Signal(str, str, QPointF)
     # Delivers a video frame grabbed on a background thread to the GUI thread.
-    _video_frame_ready = Signal(QImage)
+    # Arg: (QImage, bytes) — the image wraps the bytes without copying them.
+    _video_frame_ready = Signal(object)
 
     def __init__(self, config_manager=None, inspector_index: int = 0):
         super().__init__(None, Qt.Window)
@@ -46,34 +264,117 @@ class InspectorView(QWidget):
         self._current_image_path = None
         self._view_image_ready = False
         self._is_panning = False
-        self._last_mouse_pos = QPoint()
-
-        # Background-fetch tracking: only one socket fetch in flight at a time.
+        # why: slotted, allocated once; the pan path reads several fields per move.
+        self._pan = _PanState()
+        # View file decoded at viewport size for FIT mode, or None when the
+        # loaded image is full resolution; see _ensure_full_resolution.
+        self._fit_decoded_from: Optional[str] = None
+        # View state the last paintEvent rendered; see _on_view_state_changed.
+        self._last_painted_key: Optional[tuple] = None
+        # Zoom → pre-scaled pixmap of the current image (keyed by its cacheKey).
+        self._scaled_cache: OrderedDict[float, QPixmap] = OrderedDict()
+        self._scaled_cache_bytes = 0
+        self._scaled_cache_image_key: Optional[int] = None
+
+        # Background-fetch tracking: at most one socket fetch in flight per path.
         self._desired_image_path: Optional[str] = None
         self._desired_norm_pos: QPointF = QPointF(0.5, 0.5)
-        self._fetch_in_flight: Optional[str] = None
+        self._status_inflight: set[str] = set()
+        # Newest position seen per in-flight path; applied when its result lands.
+        self._status_requested_for: dict[str, QPointF] = {}
         # why: CPython GIL makes single bool read/write atomic; the worst case is
         # one extra signal emission after closeEvent, which Qt discards safely.
         self._fetch_cancelled = False
 
+        # Neighbor paths whose view images were already requested (LRU).
+        self._prefetched: OrderedDict[str, None] = OrderedDict()
+
         # Video scrub state
         self._scrub_player = None       # headless mpv for frame extraction
+        self._scrub_frame_buffer: Optional[bytes] = None  # backs the shown frame
+        # (video_path, norm_x span of one frame), published by the worker once
+        # it knows the duration; requests closer than that to the last one are
+        # dropped in _request_video_frame.
+        self._scrub_frame_step: tuple[Optional[str], float] = (None, 0.0)
+        self._last_scrub: tuple[Optional[str], float] = (None, -1.0)
         self._is_video_mode: bool = False
         # Persistent scrub worker: only one thread, processes latest request.
-        self._scrub_request: Optional[tuple] = None  # (video_path, norm_x)
-        self._scrub_lock = threading.Lock()
-        self._scrub_event = threading.Event()
+        # why: deque.append is atomic under the GIL, so mouse moves publish the
+        # payload without a lock; maxlen=1 keeps only the newest request.
+        self._scrub_slot: deque[tuple] = deque(maxlen=1)  # (seq, video_path, norm_x, w, h)
+        self._scrub_seq = itertools.count(1)
+        # Wakes the worker for a new request or stop; no periodic timeout wakes.
+        self._scrub_cond = threading.Condition()
         self._scrub_thread: Optional[threading.Thread] = None
-        # why: CPython GIL makes single bool read/write atomic; the worst case is
-        # one extra loop iteration in _scrub_worker after closeEvent, which is harmless.
-        self._scrub_stop = False
+        # why: each worker gets its own stop event, so a worker still tearing
+        # down mpv can never be revived by the next show starting a new one.
+        self._scrub_stop: Optional[threading.Event] = None
 
         self._pinned: bool = False
 
-        self.setWindowTitle("Inspector")
+        # why: thumbnail mouse-moves can outpace repaints; a zero-interval timer
+        # fires once the pending event queue drains, so only the newest position
+        # in a burst reaches set_center.
+        self._pending_norm_pos: Optional[QPointF] = None
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.setInterval(0)
+        self._coalesce_timer.timeout.connect(self._flush_pending_center)
+
+        # why: thumbnail hovers arrive per mouse move; act on the newest one once
+        # per frame so a drag costs one fetch/scrub request, not one per event.
+        self._pending_update: Optional[InspectorEventData] = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._flush_inspector_update)
+
+        # why: high-rate mice deliver several moves per frame; sum the drag
+        # deltas and move the view (one viewStateChanged) once per event-loop pass.
+        self._pan_timer = QTimer(self)
+        self._pan_timer.setSingleShot(True)
+        self._pan_timer.setInterval(0)
+        self._pan_timer.timeout.connect(self._flush_pan)
+
+        # why: free-spinning and hi-res wheels deliver many ticks per frame;
+        # sum them and rescale (and retitle) once per burst.
+        self._wheel_acc = 0
+        self._wheel_timer = QTimer(self)
+        self._wheel_timer.setSingleShot(True)
+        self._wheel_timer.setInterval(15)
+        self._wheel_timer.timeout.connect(self._apply_wheel_zoom)
+
+        # why: a hidden inspector should not keep mpv's decoders resident, but
+        # quick hide/show cycles (virtual desktops, minimize) must not thrash
+        # the slow player start-up; release only after staying hidden a while.
+        self._scrub_release_timer = QTimer(self)
+        self._scrub_release_timer.setSingleShot(True)
+        self._scrub_release_timer.setInterval(2000)
+        self._scrub_release_timer.timeout.connect(self._release_scrub_player)
+
+        # why: geometry/mode/zoom change in bursts (resize drags, wheel spins);
+        # persist once the burst settles instead of on every step.
+        self._settings_dirty = False
+        self._persist_timer = QTimer(self)
+        self._persist_timer.setSingleShot(True)
+        self._persist_timer.setInterval(500)
+        self._persist_timer.timeout.connect(self._persist_settings)
+
+        # why: a resize drag grows the window in many small steps; re-decode a
+        # FIT-capped image once the drag settles, not on every step.
+        self._fit_decode_timer = QTimer(self)
+        self._fit_decode_timer.setSingleShot(True)
+        self._fit_decode_timer.setInterval(150)
+        self._fit_decode_timer.timeout.connect(self._redecode_for_fit)
+
+        self._window_title = "Inspector"
+        self.setWindowTitle(self._window_title)
         self.setMinimumSize(200, 200)
+        # why: paintEvent covers every pixel itself, so Qt's background erase
+        # before each paint is wasted fill-rate.
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
 
-        settings = QSettings("RabbitViewer", "Inspector")
+        settings = self._settings()
         geometry = settings.value(f"geometry_{self._inspector_index}")
         if geometry:
             self.restoreGeometry(geometry)
@@ -86,15 +387,14 @@ class InspectorView(QWidget):
             self._zoom_factor = float(self.config_manager.get("inspector.zoom_factor", 3.0))
         else:
             self._zoom_factor = 3.0
-        try:
-            view_mode_str = settings.value(f"view_mode_{self._inspector_index}", _ViewMode.TRACKING.value)
-            self._view_mode = _ViewMode(view_mode_str)
-        except ValueError:
-            self._view_mode = _ViewMode.TRACKING
+        self._persisted_zoom = self._zoom_factor
+        view_mode_str = settings.value(f"view_mode_{self._inspector_index}", _ViewMode.TRACKING.value)
+        self._view_mode = _MODE_FROM_STR.get(view_mode_str, _ViewMode.TRACKING)
         self._update_window_title()
 
-        self._picture_base.viewStateChanged.connect(self.update)
-        self._preview_status_ready.connect(self._on_preview_status_ready)
+        # why: emitter and receiver both live on the GUI thread; an explicit
+        # DirectConnection skips AutoConnection's per-emit thread-affinity check.
+        self._picture_base.viewStateChanged.connect(self._on_view_state_changed, Qt.DirectConnection)
         self._video_frame_ready.connect(self._on_video_frame_ready)
 
         self._picture_base.setZoom(self._zoom_factor)
@@ -104,6 +404,26 @@ class InspectorView(QWidget):
         self.socket_client: Optional[ThumbnailSocketClient] = None
         self._daemon_signals: DaemonSignals | None = None
 
+    @property
+    def _view_mode(self) -> _ViewMode:
+        return self._view_mode_enum
+
+    @_view_mode.setter
+    def _view_mode(self, mode: _ViewMode) -> None:
+        # why: hot handlers compare the int instead of going through Enum.__eq__.
+        self._view_mode_enum = mode
+        self._view_mode_int = _VM_INT[mode]
+
+    @classmethod
+    def _settings(cls) -> QSettings:
+        """Return the shared QSettings, created on first use (after QApplication).
+
+        GUI thread only; off-thread writers such as _write_settings build their own.
+        """
+        if cls._shared_settings is None:
+            cls._shared_settings = QSettings("RabbitViewer", "Inspector")
+        return cls._shared_settings
+
     def set_daemon_signals(self, daemon_signals: DaemonSignals) -> None:
         self._daemon_signals = daemon_signals
         daemon_signals.previews_ready.connect(self._on_previews_ready)
@@ -115,11 +435,14 @@ class InspectorView(QWidget):
         # empty and _current_image_path was never set to the desired path).
         # Skip if in video mode — scrub worker manages the display.
         target = data.image_entry.path
-        is_target = (target == self._current_image_path
-                     or target == self._desired_image_path)
-        view_ready = data.view_image_path or data.view_image_source == "memory"
-        if view_ready and is_target and not self._is_video_mode:
-            norm_pos = self._desired_norm_pos if self._view_mode == _ViewMode.TRACKING else QPointF(0.5, 0.5)
+        _StatusBatcher.instance().invalidate(target)
+        # why: notifications arrive for every file the daemon finishes; bail
+        # out on the common non-target case before reading the rest of the payload.
+        if self._is_video_mode or (target != self._current_image_path
+                                   and target != self._desired_image_path):
+            return
+        if data.view_image_path or data.view_image_source == "memory":
+            norm_pos = self._desired_norm_pos if self._view_mode_int == _VM_TRACKING else QPointF(0.5, 0.5)
             if data.view_image_source == "memory":
                 self._load_mem_cached_view(target, norm_pos)
             else:
@@ -133,18 +456,20 @@ class InspectorView(QWidget):
                     and self._desired_image_path != self._current_image_path
                     and self.socket_client):
                 self._view_image_ready = False
-                self._fetch_in_flight = self._desired_image_path
-                threading.Thread(
-                    target=self._fetch_preview_status,
-                    args=(self._desired_image_path, self._desired_norm_pos),
-                    daemon=True,
-                    name="inspector-fetch",
-                ).start()
+                self._start_status_fetch(self._desired_image_path, self._desired_norm_pos)
         self._update_window_title()
 
     def _handle_inspector_update(self, event_data: InspectorEventData):
         if not self.isVisible():
             return
+        self._pending_update = event_data
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _flush_inspector_update(self):
+        event_data, self._pending_update = self._pending_update, None
+        if event_data is None:
+            return
 
         logging.debug("Inspector update: %s at (%.3f, %.3f)",
                       event_data.image_path,
@@ -157,19 +482,19 @@ class InspectorView(QWidget):
         # ------ PINNED: ignore image changes, still track position ------
         if self._pinned and image_path != self._current_image_path:
             self._desired_norm_pos = norm_pos
-            if self._view_mode == _ViewMode.TRACKING:
-                self.set_center(norm_pos)
+            if self._view_mode_int == _VM_TRACKING:
+                self._schedule_center(norm_pos)
             return
 
         # ------ VIDEO PATH ------
-        if _is_video(image_path):
+        if is_video(image_path):
             self._is_video_mode = True
             self._desired_image_path = image_path
             self._desired_norm_pos = norm_pos
             self._current_image_path = image_path
             self._view_image_ready = True
 
-            if self._view_mode in (_ViewMode.TRACKING, _ViewMode.FIT):
+            if self._view_mode_int != _VM_MANUAL:
                 self._request_video_frame(image_path, norm_pos.x())
             # MANUAL: user controls scrub via mouse drag in inspector
             self._update_window_title()
@@ -190,61 +515,41 @@ class InspectorView(QWidget):
         # why: skip socket if image already loaded; _view_image_ready stays True
         # until a different image is hovered (stale only if view file is deleted).
         if same_image and self._view_image_ready:
-            if self._view_mode == _ViewMode.TRACKING:
-                self.set_center(norm_pos)
+            if self._view_mode_int == _VM_TRACKING:
+                self._schedule_center(norm_pos)
             return
 
         if not self.socket_client:
             return
 
         # If a fetch is already in flight for this exact path, skip — the result
-        # will arrive via _on_preview_status_ready when the thread finishes.
-        if self._fetch_in_flight == image_path:
+        # will arrive via _on_preview_status_ready and use this newer position.
+        if image_path in self._status_inflight:
+            self._status_requested_for[image_path] = norm_pos
             return
 
         # Clear the display immediately when switching to a new image.
         if not same_image and self._current_image_path is not None:
             self._picture_base.setImage(QImage())
 
-        self._fetch_in_flight = image_path
-        threading.Thread(
-            target=self._fetch_preview_status,
-            args=(image_path, norm_pos),
-            daemon=True,
-            name="inspector-fetch",
-        ).start()
+        self._start_status_fetch(image_path, norm_pos)
 
-    def _fetch_preview_status(self, image_path: str, norm_pos: QPointF):
-        try:
-            response = self.socket_client.get_previews_status([image_path])
-            view_image_path = ""
-            if response and response.status == "success":
-                status = response.statuses.get(image_path)
-                if status and status.view_image_ready and status.view_image_path:
-                    view_image_path = status.view_image_path
-
-            if not view_image_path:
-                # Request generation; result will arrive via previews_ready daemon notification.
-                result = self.socket_client.request_view_image(image_path)
-                if result and result.status == "success":
-                    if result.view_image_source == "memory":
-                        # Mem-cached — emit sentinel so main thread fetches bytes.
-                        view_image_path = "memory"
-                    elif result.view_image_path:
-                        view_image_path = result.view_image_path
-        except Exception as e:
-            # why: socket calls can raise ConnectionError/OSError/TimeoutError on
-            # NAS drop or pool exhaustion; log and emit empty path to unblock GUI.
-            logging.error("Inspector: error fetching preview status for %s: %s", image_path, e)
-            view_image_path = ""
+    def _start_status_fetch(self, image_path: str, norm_pos: QPointF):
+        self._status_inflight.add(image_path)
+        self._status_requested_for[image_path] = norm_pos
+        _StatusBatcher.instance().request(
+            self.socket_client, image_path,
+            lambda path, view_path, pos=norm_pos: self._on_status_ready(path, view_path, pos),
+        )
 
+    def _on_status_ready(self, image_path: str, view_image_path: str, norm_pos: QPointF):
+        # why: the batcher outlives this window; drop results once closeEvent ran.
         if not self._fetch_cancelled:
-            self._preview_status_ready.emit(image_path, view_image_path, norm_pos)
+            self._on_preview_status_ready(image_path, view_image_path, norm_pos)
 
-    @Slot(str, str, QPointF)
     def _on_preview_status_ready(self, image_path: str, view_image_path: str, norm_pos: QPointF):
-        if self._fetch_in_flight == image_path:
-            self._fetch_in_flight = None
+        self._status_inflight.discard(image_path)
+        norm_pos = self._status_requested_for.pop(image_path, norm_pos)
 
         # Discard stale results if the user has already moved to a different image.
         if image_path != self._desired_image_path:
@@ -258,7 +563,7 @@ class InspectorView(QWidget):
             self._load_mem_cached_view(image_path, norm_pos)
             return
 
-        if self._view_mode != _ViewMode.TRACKING:
+        if self._view_mode_int != _VM_TRACKING:
             if image_path != self._current_image_path:
                 self.update_view(image_path, view_image_path, QPointF(0.5, 0.5))
         else:
@@ -275,14 +580,15 @@ class InspectorView(QWidget):
         if image_path != self._current_image_path:
             success = self._picture_base.loadImageFromBytes(image_bytes)
             if success:
+                self._fit_decoded_from = None
                 self._current_image_path = image_path
                 self._view_image_ready = True
                 self._picture_base.setViewportSize(self.size())
-                if self._view_mode == _ViewMode.FIT:
+                if self._view_mode_int == _VM_FIT:
                     self._picture_base.setFitMode(True)
                 else:
                     self._picture_base.setZoom(self._zoom_factor)
-        if self._view_mode == _ViewMode.TRACKING:
+        if self._view_mode_int == _VM_TRACKING:
             self.set_center(norm_pos)
 
     def update_view(self, original_image_path: str, view_image_path: str, norm_pos: QPointF):
@@ -290,14 +596,14 @@ class InspectorView(QWidget):
             return
 
         if original_image_path != self._current_image_path:
-            success = self._picture_base.loadImageFromPath(view_image_path)
+            success = self._load_view_file(view_image_path)
 
             if success:
                 self._current_image_path = original_image_path
                 self._view_image_ready = True
                 logging.info("Inspector displaying image: %s", original_image_path)
                 self._picture_base.setViewportSize(self.size())
-                if self._view_mode == _ViewMode.FIT:
+                if self._view_mode_int == _VM_FIT:
                     self._picture_base.setFitMode(True)
                 else:
                     self._picture_base.setZoom(self._zoom_factor)
@@ -306,79 +612,243 @@ class InspectorView(QWidget):
                 logging.warning("Inspector failed to load image: %s", original_image_path)
                 return
 
-        if self._view_mode == _ViewMode.TRACKING:
+        if self._view_mode_int == _VM_TRACKING:
             self.set_center(norm_pos)
 
+    def _device_size(self) -> QSize:
+        """Widget size in device pixels, the most a FIT image can show."""
+        dpr = self.devicePixelRatioF()
+        return QSize(math.ceil(self.width() * dpr), math.ceil(self.height() * dpr))
+
+    def _load_view_file(self, view_image_path: str) -> bool:
+        # why: FIT never shows more than viewport-sized pixels, so let the decoder
+        # scale down (JPEG DCT scaling); other modes zoom into source pixels.
+        pb = self._picture_base
+        fit = self._view_mode_int == _VM_FIT
+        success = pb.loadImageFromPath(
+            view_image_path, self._device_size() if fit else None)
+        # Only a capped decode has more pixels to give on resize or zoom-in.
+        self._fit_decoded_from = (view_image_path if success and fit and pb.isDecodeScaled()
+                                  else None)
+        return success
+
+    def _redecode_for_fit(self):
+        """Decode a FIT-capped image again once the window has outgrown it."""
+        path = self._fit_decoded_from
+        if not path or not self._current_image_path or self._view_mode_int != _VM_FIT:
+            return
+        image = self._picture_base.get_image()
+        size = self._device_size()
+        if image is None or image.width() >= size.width() or image.height() >= size.height():
+            return
+        if self._load_view_file(path):
+            self._picture_base.setViewportSize(self.size())
+            self._picture_base.setFitMode(True)
+
+    def _ensure_full_resolution(self):
+        """Reload at full size an image that was decoded for FIT mode."""
+        path, self._fit_decoded_from = self._fit_decoded_from, None
+        if path and self._picture_base.loadImageFromPath(path):
+            self._picture_base.setViewportSize(self.size())
+
     def set_center(self, norm_pos: QPointF):
-        if self._current_image_path:
-            # why: setCenter emits viewStateChanged → self.update; explicit update() is redundant.
-            self._picture_base.setCenter(norm_pos)
+        if not self._current_image_path:
+            return
+        pb = self._picture_base
+        # why: moves smaller than one screen pixel render an identical frame;
+        # comparing against the applied center lets slow drags still accumulate.
+        side = pb.paddedRect().width() * pb.viewState().zoom
+        step = 1.0 / side if side > 0 else 0.0
+        center = pb.viewState().center
+        if abs(norm_pos.x() - center.x()) < step and abs(norm_pos.y() - center.y()) < step:
+            return
+        # why: setCenter emits viewStateChanged → self.update; explicit update() is redundant.
+        pb.setCenter(norm_pos)
+
+    def _schedule_center(self, norm_pos: QPointF):
+        self._pending_norm_pos = norm_pos
+        if not self._coalesce_timer.isActive():
+            self._coalesce_timer.start()
+
+    def _flush_pending_center(self):
+        norm_pos, self._pending_norm_pos = self._pending_norm_pos, None
+        if norm_pos is not None:
+            self.set_center(norm_pos)
 
     def set_zoom_factor(self, zoom: float):
         # why: tighter bounds than PictureBase (0.01–50.0) because the inspector
         # window is small; sub-0.1x is invisible and >20x is pixelated noise.
         self._zoom_factor = max(0.1, min(zoom, 20.0))
         self._update_window_title()
+        self._mark_settings_dirty()
         # why: defer PictureBase sync until an image is loaded; update_view() applies
         # self._zoom_factor when the next image loads, keeping state consistent.
         if self._current_image_path:
-            if self._view_mode == _ViewMode.FIT:
+            if self._view_mode_int == _VM_FIT:
                 self._view_mode = _ViewMode.TRACKING
+            self._ensure_full_resolution()
             self._picture_base.setFitMode(False)
             self._picture_base.setZoom(self._zoom_factor)
 
     def _enter_manual_mode(self):
         """Detach from thumbnail mouse tracking; user has taken direct control."""
-        if self._view_mode != _ViewMode.MANUAL:
+        if self._view_mode_int != _VM_MANUAL:
             self._view_mode = _ViewMode.MANUAL
             self._update_window_title()
+            self._mark_settings_dirty()
+
+    def _mark_settings_dirty(self):
+        self._settings_dirty = True
+        self._persist_timer.start()
+
+    def _persist_settings(self):
+        """Stage window settings in QSettings; Qt flushes them to disk lazily."""
+        if not self._settings_dirty:
+            return
+        self._settings_dirty = False
+        settings = self._settings()
+        settings.setValue(f"geometry_{self._inspector_index}", self.saveGeometry())
+        settings.setValue(f"view_mode_{self._inspector_index}", self._view_mode.value)
 
     def _update_window_title(self):
-        pin_suffix = " (Pinned)" if self._pinned else ""
-        if self._is_video_mode:
-            if self._view_mode == _ViewMode.FIT:
-                self.setWindowTitle(f"Inspector - Video Fit{pin_suffix}")
-            elif self._view_mode == _ViewMode.MANUAL:
-                self.setWindowTitle(f"Inspector - Video Scrub (Manual){pin_suffix}")
-            else:
-                self.setWindowTitle(f"Inspector - Video Scrub (Tracking){pin_suffix}")
-        else:
-            if self._view_mode == _ViewMode.FIT:
-                self.setWindowTitle(f"Inspector - Fit Mode{pin_suffix}")
-            elif self._view_mode == _ViewMode.MANUAL:
-                self.setWindowTitle(f"Inspector - Locked ({self._zoom_factor:.1f}x Zoom){pin_suffix}")
-            else:
-                self.setWindowTitle(f"Inspector - Tracking ({self._zoom_factor:.1f}x Zoom){pin_suffix}")
+        title = _TITLES[self._is_video_mode, self._view_mode].format(zoom=self._zoom_factor)
+        if self._pinned:
+            title += " (Pinned)"
+        # why: setWindowTitle round-trips to the window manager even when unchanged.
+        if title != self._window_title:
+            self._window_title = title
+            self.setWindowTitle(title)
+
+    def _paint_key(self) -> Optional[tuple]:
+        image = self._picture_base.get_image()
+        if image is None:
+            return None
+        state = self._picture_base.viewState()
+        size = state.viewport_size
+        return (state.center.x(), state.center.y(), state.zoom,
+                size.width(), size.height(), image.cacheKey())
+
+    def _on_view_state_changed(self, _state):
+        # why: repeated signals with an unchanged view state would repaint the
+        # same pixels; only schedule a paint when the rendered frame differs.
+        if self._paint_key() != self._last_painted_key:
+            self.update()
 
     def paintEvent(self, event):
         if not self._current_image_path or not self._picture_base.has_image():
+            self._last_painted_key = None
+            # why: WA_OpaquePaintEvent means nothing else clears the widget.
+            QPainter(self).fillRect(self.rect(), self.palette().window())
             return
+        self._last_painted_key = self._paint_key()
 
         painter = QPainter(self)
         painter.setRenderHint(QPainter.SmoothPixmapTransform)
-        painter.fillRect(self.rect(), Qt.black)
         # why: viewport size is kept current by resizeEvent; no need to sync here
         # (doing so inside paintEvent emits viewStateChanged → schedules a second repaint)
         transform = self._picture_base.calculateTransform()
+        self._fill_letterbox(painter, transform)
+        zoom = self._picture_base.viewState().zoom
+        # why: a right-drag zoom changes zoom on every mouse move, so a
+        # pre-scaled copy would be a full-source rescale per frame, never reused.
+        if zoom < 1.0 and not self._picture_base.isDragZooming():
+            # why: minified draws would resample the full-resolution source every
+            # frame; a pixmap pre-scaled to this zoom is blitted 1:1 while panning.
+            painter.drawPixmap(transform.map(QPointF(0, 0)), self._scaled_pixmap(zoom))
+            return
         painter.setTransform(transform)
         image_rect = self._picture_base.imageRect()
-        painter.drawImage(image_rect, self._picture_base.get_image())
+        # why: the pixmap is already in the display's native format, so repeated
+        # pans blit it instead of converting the QImage on every frame.
+        painter.drawPixmap(image_rect, self._picture_base.get_pixmap(), image_rect)
+
+    def _fill_letterbox(self, painter: QPainter, transform):
+        """Fill black only where the image will not cover the widget."""
+        if self._picture_base.get_image().hasAlphaChannel():
+            # Transparent pixels show whatever is underneath.
+            painter.fillRect(self.rect(), Qt.black)
+            return
+        mapped = transform.mapRect(self._picture_base.imageRect())
+        # Largest whole-pixel rect fully inside the image; edge pixels get filled.
+        covered = QRect(QPoint(math.ceil(mapped.left()), math.ceil(mapped.top())),
+                        QPoint(math.floor(mapped.right()) - 1, math.floor(mapped.bottom()) - 1))
+        uncovered = QRegion(self.rect()).subtracted(QRegion(covered))
+        if uncovered.isEmpty():
+            return
+        painter.setClipRegion(uncovered)
+        painter.fillRect(self.rect(), Qt.black)
+        painter.setClipping(False)
+
+    def _scaled_pixmap(self, zoom: float) -> QPixmap:
+        """Return the current image scaled by zoom, cached per zoom level."""
+        image_key = self._picture_base.get_image().cacheKey()
+        if image_key != self._scaled_cache_image_key:
+            self._scaled_cache.clear()
+            self._scaled_cache_bytes = 0
+            self._scaled_cache_image_key = image_key
+
+        pixmap = self._scaled_cache.get(zoom)
+        if pixmap is not None:
+            self._scaled_cache.move_to_end(zoom)
+            return pixmap
+
+        source = self._picture_base.get_pixmap()
+        size = QSize(max(1, round(source.width() * zoom)),
+                     max(1, round(source.height() * zoom)))
+        pixmap = source.scaled(size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        self._scaled_cache[zoom] = pixmap
+        self._scaled_cache_bytes += _pixmap_bytes(pixmap)
+        # Always keep the newest entry, even if it alone exceeds the budget.
+        while self._scaled_cache_bytes > self._SCALED_CACHE_MAX_BYTES and len(self._scaled_cache) > 1:
+            _, evicted = self._scaled_cache.popitem(last=False)
+            self._scaled_cache_bytes -= _pixmap_bytes(evicted)
+        return pixmap
 
     def showEvent(self, event):
         super().showEvent(event)
         # why: _fetch_cancelled is set True in closeEvent; reset here so fetches
         # work again when the window is re-opened in the same session.
         self._fetch_cancelled = False
+        # Results of fetches cancelled by closeEvent were never delivered.
+        self._status_inflight.clear()
+        self._status_requested_for.clear()
+        # why: creating the mpv instance takes hundreds of ms; do it while the
+        # window opens so the first video hover only pays for the seek.
+        self._scrub_release_timer.stop()
+        self._ensure_scrub_worker()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._scrub_release_timer.start()
+
+    def _release_scrub_player(self):
+        if self.isVisible():
+            return
+        self._destroy_scrub_player()
+        if self._is_video_mode:
+            self._is_video_mode = False
+            self._update_window_title()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        self._mark_settings_dirty()
         if self._current_image_path:
+            if self._fit_decoded_from and self._view_mode_int == _VM_FIT:
+                self._fit_decode_timer.start()
             self._picture_base.setViewportSize(self.size())
-            if self._view_mode == _ViewMode.FIT:
+            if self._view_mode_int == _VM_FIT:
                 self._picture_base.setFitMode(True)
 
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        self._mark_settings_dirty()
+
     def mousePressEvent(self, event):
-        if self._view_mode == _ViewMode.FIT:
+        # why: the FIT guards stay as plain int compares rather than swapping
+        # handlers per mode. Mouse tracking is off, so only presses and drags
+        # reach these handlers, and per-instance method swaps are not a reliable
+        # way to keep shiboken from dispatching the Python override.
+        if self._view_mode_int == _VM_FIT:
             return
         # why: do NOT call _enter_manual_mode() here — Qt fires mousePressEvent
         # before mouseDoubleClickEvent, so entering manual on press would prevent
@@ -386,7 +856,9 @@ class InspectorView(QWidget):
         # the first actual drag in mouseMoveEvent instead.
         if event.button() == Qt.LeftButton:
             self._is_panning = True
-            self._last_mouse_pos = event.position().toPoint()
+            pos = event.position()
+            self._pan.last_x, self._pan.last_y = pos.x(), pos.y()
+            self._build_pan_cache()
             self.setCursor(Qt.CursorShape.ClosedHandCursor)
         elif event.button() == Qt.RightButton:
             zoom_anchor = self._picture_base.screenToNormalized(QPointF(event.position()))
@@ -394,21 +866,30 @@ class InspectorView(QWidget):
         super().mousePressEvent(event)
 
     def mouseReleaseEvent(self, event):
-        if self._view_mode == _ViewMode.FIT:
+        if self._view_mode_int == _VM_FIT:
             return
         if event.button() == Qt.LeftButton:
+            if (self._is_video_mode and self._view_mode_int == _VM_MANUAL and self._is_panning
+                    and self._current_image_path and self.width() > 0):
+                # The drag may have ended inside a dropped sub-frame step; show it.
+                norm_x = max(0.0, min(1.0, event.position().x() / self.width()))
+                if norm_x != self._last_scrub[1]:
+                    self._request_video_frame(self._current_image_path, norm_x, force=True)
+            self._pan_timer.stop()
+            self._flush_pan()
             self._is_panning = False
+            self._pan.valid = False
             self.setCursor(Qt.ArrowCursor)
         elif event.button() == Qt.RightButton:
             self._picture_base.endDragZoom()
         super().mouseReleaseEvent(event)
 
     def mouseMoveEvent(self, event):
-        if self._view_mode == _ViewMode.FIT:
+        if self._view_mode_int == _VM_FIT:
             return
 
         # Video manual scrub: mouse X maps to timeline position.
-        if self._is_video_mode and self._view_mode == _ViewMode.MANUAL:
+        if self._is_video_mode and self._view_mode_int == _VM_MANUAL:
             if self._is_panning and self.width() > 0 and self._current_image_path:
                 norm_x = max(0.0, min(1.0, event.position().x() / self.width()))
                 self._request_video_frame(self._current_image_path, norm_x)
@@ -416,139 +897,270 @@ class InspectorView(QWidget):
 
         if self._is_panning:
             self._enter_manual_mode()
-            delta = event.position().toPoint() - self._last_mouse_pos
-            self._last_mouse_pos = event.position().toPoint()
-
-            transform = self._picture_base.calculateTransform()
-            inv_transform, invertible = transform.inverted()
-            if invertible:
-                delta_normalized = inv_transform.map(QPointF(delta)) - inv_transform.map(QPointF(0, 0))
-
-                current_center = self._picture_base.viewState().center
-                new_center = QPointF(
-                    current_center.x() - delta_normalized.x() / self._picture_base.paddedRect().width(),
-                    current_center.y() + delta_normalized.y() / self._picture_base.paddedRect().height()
-                )
-                self._picture_base.setCenter(new_center)
+            pan = self._pan
+            pos = event.position()
+            x, y = pos.x(), pos.y()
+            pan.pending_dx += x - pan.last_x
+            pan.pending_dy += y - pan.last_y
+            pan.last_x, pan.last_y = x, y
+            if not self._pan_timer.isActive():
+                self._pan_timer.start()
         elif self._picture_base.isDragZooming():
             new_zoom = self._picture_base.computeDragZoom(event.position())
             if new_zoom is not None:
                 self.set_zoom_factor(new_zoom)
         super().mouseMoveEvent(event)
 
+    def _flush_pan(self):
+        pan = self._pan
+        dx, dy = pan.pending_dx, pan.pending_dy
+        pan.pending_dx = pan.pending_dy = 0.0
+        if not dx and not dy:
+            return
+        if not pan.valid or pan.version != self._picture_base.scaleVersion():
+            self._build_pan_cache()
+        if pan.valid:
+            # why: for an affine transform inv.map(d) - inv.map(0) is just the
+            # linear part applied to d, so no matrix inversion per event.
+            dnx = pan.m11 * dx + pan.m21 * dy
+            dny = pan.m12 * dx + pan.m22 * dy
+
+            center = self._picture_base.viewState().center
+            self._picture_base.setCenterXY(center.x() - dnx / pan.padded_w,
+                                           center.y() + dny / pan.padded_h)
+
+    def _build_pan_cache(self) -> None:
+        """Snapshot the inverse transform's linear part into self._pan."""
+        pb = self._picture_base
+        pan = self._pan
+        inv_transform, invertible = pb.cachedInverseTransform()
+        pan.valid = invertible
+        if not invertible:
+            return
+        padded = pb.paddedRect()
+        pan.version = pb.scaleVersion()
+        pan.m11, pan.m12 = inv_transform.m11(), inv_transform.m12()
+        pan.m21, pan.m22 = inv_transform.m21(), inv_transform.m22()
+        pan.padded_w, pan.padded_h = padded.width(), padded.height()
+
     def mouseDoubleClickEvent(self, event):
         if event.button() == Qt.LeftButton:
-            if self._view_mode == _ViewMode.FIT:
+            if self._view_mode_int == _VM_FIT:
                 self._view_mode = _ViewMode.TRACKING
+                self._ensure_full_resolution()
                 self._picture_base.setFitMode(False)
                 self._picture_base.setZoom(self._zoom_factor)
             else:
                 self._view_mode = _ViewMode.FIT
                 self._picture_base.setFitMode(True)
             self._update_window_title()
+            self._mark_settings_dirty()
         super().mouseDoubleClickEvent(event)
 
     def wheelEvent(self, event):
-        if self._view_mode == _ViewMode.FIT:
+        if self._view_mode_int == _VM_FIT:
             self._view_mode = _ViewMode.TRACKING
+            self._ensure_full_resolution()
             self._picture_base.setFitMode(False)
             self._picture_base.setZoom(self._zoom_factor)
             self._update_window_title()
-        factor = 1.25 if event.angleDelta().y() > 0 else 1/1.25
-        self.set_zoom_factor(self._zoom_factor * factor)
+        self._wheel_acc += 1 if event.angleDelta().y() > 0 else -1
+        if not self._wheel_timer.isActive():
+            self._wheel_timer.start()
         event.accept()
 
+    def _apply_wheel_zoom(self):
+        steps, self._wheel_acc = self._wheel_acc, 0
+        if steps:
+            factor = _POW125.get(steps) or 1.25 ** steps
+            self.set_zoom_factor(self._zoom_factor * factor)
+
+    def prefetch_neighbors(self, paths: list[str], executor: Executor) -> None:
+        """Ask the daemon to build view images for paths near the hovered one.
+
+        Fire-and-forget on the caller's executor: results surface later through
+        previews_ready, so the next hover over one of these paths takes the
+        fast path.
+        """
+        if not self.socket_client:
+            return
+        fresh = []
+        for path in paths:
+            if path in self._prefetched:
+                self._prefetched.move_to_end(path)
+            elif not is_video(path):
+                self._prefetched[path] = None
+                fresh.append(path)
+        while len(self._prefetched) > self._PREFETCH_LRU_MAX:
+            self._prefetched.popitem(last=False)
+        if fresh:
+            executor.submit(self._request_view_images, self.socket_client, fresh)
+
+    @staticmethod
+    def _request_view_images(socket_client: ThumbnailSocketClient, paths: list[str]):
+        # why: one task for the whole batch; request_view_image is single-path.
+        for path in paths:
+            try:
+                socket_client.request_view_image(path)
+            except Exception as e:  # why: prefetch is best-effort; a dropped socket must not kill the thread
+                logging.debug("Inspector: neighbor prefetch failed for %s: %s", path, e)
+
     def set_socket_client(self, socket_client: ThumbnailSocketClient):
         self.socket_client = socket_client
 
     # --------------------------------------------------------- video scrub player
 
-    def _request_video_frame(self, video_path: str, norm_x: float):
-        """Post the latest scrub request; the persistent worker picks it up."""
-        with self._scrub_lock:
-            self._scrub_request = (video_path, norm_x)
-        self._scrub_event.set()
-        # Start the worker thread on first request.
+    def _request_video_frame(self, video_path: str, norm_x: float, force: bool = False):
+        """Post the latest scrub request; the persistent worker picks it up.
+
+        Requests that would land on the frame already requested are dropped
+        unless force is set.
+        """
+        if not force:
+            step_path, step = self._scrub_frame_step
+            last_path, last_x = self._last_scrub
+            if video_path == last_path == step_path and abs(norm_x - last_x) < step:
+                return
+        self._last_scrub = (video_path, norm_x)
+        # why: the scale box is in device pixels, or frames look soft on HiDPI.
+        box = self._device_size()
+        self._scrub_slot.append((next(self._scrub_seq), video_path, norm_x,
+                                 box.width(), box.height()))
+        with self._scrub_cond:
+            self._scrub_cond.notify()
+        self._ensure_scrub_worker()
+
+    def _ensure_scrub_worker(self):
+        """Start the scrub worker unless it is running or mpv is unavailable."""
+        if InspectorView._mpv_missing:
+            return
         if self._scrub_thread is None or not self._scrub_thread.is_alive():
-            self._scrub_stop = False
+            self._scrub_stop = threading.Event()
             self._scrub_thread = threading.Thread(
                 target=self._scrub_worker,
+                args=(self._scrub_stop,),
                 daemon=True,
                 name="inspector-scrub-worker",
             )
             self._scrub_thread.start()
 
-    def _scrub_worker(self):
+    def _scrub_worker(self, stop: threading.Event):
         """Persistent background thread: processes the latest scrub request."""
         try:
             import mpv as _mpv
         except Exception as e:  # why: mpv is an optional dependency; missing lib should not crash the worker thread
             logging.error("Failed to import mpv for scrub worker: %s", e)
+            InspectorView._mpv_missing = True
             return
 
         player = None
+        handled_seq = 0
         loaded_path: str | None = None
+        scaled_to: tuple[int, int] | None = None
         duration: float = 0.0
 
         try:
-            player = _mpv.MPV(vo="null", ao="null", aid="no", hwdec="auto-safe",
+            player = _mpv.MPV(vo="null", ao="null", aid="no", sid="no", hwdec="auto-safe",
                                hr_seek="yes", keep_open="yes",
                                pause=True)
         except Exception as e:  # why: mpv player creation can fail for GPU/driver/config reasons; degrade gracefully
             logging.error("Failed to create scrub player: %s", e)
             return
 
-        import time as _time
+        # why: mpv reports duration/time-pos changes from its event thread; waking
+        # on those beats sleep-polling the properties for up to a quarter second.
+        duration_ready = threading.Event()
+        seek_done = threading.Event()
+        target: float | None = None
 
-        while not self._scrub_stop:
-            self._scrub_event.wait(timeout=5.0)
-            if self._scrub_stop:
-                break
-            self._scrub_event.clear()
+        def _on_duration(_name, value):
+            if value and value > 0:
+                duration_ready.set()
 
-            # Drain to latest request.
-            with self._scrub_lock:
-                req = self._scrub_request
-                self._scrub_request = None
-            if req is None:
-                continue
+        def _on_time_pos(_name, value):
+            if value is not None and target is not None and abs(value - target) < 0.1:
+                seek_done.set()
+
+        try:
+            player.observe_property("duration", _on_duration)
+            player.observe_property("time-pos", _on_time_pos)
+        except Exception as e:  # why: same failure modes as creation; don't leak the player
+            logging.error("Failed to observe scrub player properties: %s", e)
+            try:
+                player.terminate()
+            except Exception:  # why: terminate can raise if process already dead
+                pass
+            return
+
+        slot = self._scrub_slot
 
-            video_path, norm_x = req
+        def _has_work():
+            return stop.is_set() or (bool(slot) and slot[-1][0] != handled_seq)
+
+        while True:
+            with self._scrub_cond:
+                self._scrub_cond.wait_for(_has_work)
+            if stop.is_set():
+                break
+
+            # why: read without clearing; a clear() could drop a request appended
+            # between the read and the clear. The seq tells new from handled.
+            seq, video_path, norm_x, box_w, box_h = slot[-1]
+            handled_seq = seq
 
             try:
                 # Load video if changed.
                 if loaded_path != video_path:
+                    duration_ready.clear()
                     player.play(video_path)
-                    # Player starts paused; poll until demuxer reports duration.
-                    for _ in range(100):
-                        _time.sleep(0.02)
-                        dur = player.duration
-                        if dur and dur > 0:
-                            break
+                    # Player starts paused; wait until the demuxer reports duration.
+                    duration_ready.wait(2.0)
                     duration = player.duration or 0.0
                     loaded_path = video_path
+                    if duration > 0:
+                        fps = player.container_fps or _SCRUB_FALLBACK_FPS
+                        self._scrub_frame_step = (video_path, 1.0 / max(1, int(duration * fps)))
 
                 if duration <= 0:
                     continue
 
+                # why: frames are always shown fit-to-window, so let mpv scale
+                # them down to the inspector; screenshot, copy and paint then
+                # move viewport-sized frames instead of full video resolution.
+                rescaled = scaled_to != (box_w, box_h)
+                if rescaled:
+                    scaled_to = (box_w, box_h)
+                    try:
+                        player.vf = (f"lavfi-scale=w={box_w}:h={box_h}"
+                                     ":force_original_aspect_ratio=decrease")
+                    except Exception as e:  # why: filter may be unavailable in this mpv build; grab full-size frames
+                        logging.debug("Scrub worker could not set scale filter: %s", e)
+
                 target = max(0.0, min(norm_x * duration, duration))
-                player.seek(target, reference="absolute")
-                # Wait for the async seek to settle before grabbing.
-                for _ in range(25):
-                    _time.sleep(0.01)
-                    tp = player.time_pos
-                    if tp is not None and abs(tp - target) < 0.1:
-                        break
-
-                raw = player.screenshot_raw()
-                if hasattr(raw, 'tobytes'):
-                    if raw.mode != 'RGBA':
-                        raw = raw.convert('RGBA')
-                    w, h = raw.size
-                    data = raw.tobytes()
-                    qimg = QImage(data, w, h, QImage.Format_RGBA8888).copy()
-                    if not self._scrub_stop:
-                        self._video_frame_ready.emit(qimg)
+                seek_done.clear()
+                tp = player.time_pos
+                # why: time-pos only notifies on change, so a seek onto the current
+                # position would never signal; grab the frame directly instead.
+                # A new scale filter only applies to freshly decoded frames.
+                if rescaled or tp is None or abs(tp - target) >= 0.1:
+                    player.seek(target, reference="absolute")
+                    # Wait for the async seek to settle before grabbing.
+                    seek_done.wait(0.5)
+
+                # why: screenshot_raw() round-trips the frame through PIL
+                # (frombytes, split, merge, then our RGBA convert + tobytes);
+                # mpv's bgr0 bytes are already QImage's native RGB32 layout.
+                # "video" grabs the decoded frame as-is, with no subtitle pass.
+                shot = player.node_command("screenshot-raw", "video")
+                # A newer request for another video makes this frame useless.
+                if slot[-1][1] != video_path:
+                    continue
+                if shot and shot.get("format") == "bgr0":
+                    data = shot["data"]
+                    qimg = QImage(data, shot["w"], shot["h"], shot["stride"],
+                                  QImage.Format_RGB32)
+                    if not stop.is_set():
+                        self._video_frame_ready.emit((qimg, data))
             except Exception as e:  # why: mpv seek/screenshot can fail on corrupt frames or driver errors; skip frame silently
                 logging.debug("Scrub worker frame grab failed: %s", e)
 
@@ -558,32 +1170,67 @@ class InspectorView(QWidget):
         except Exception:  # why: terminate can raise if process already dead
             pass
 
-    @Slot(QImage)
-    def _on_video_frame_ready(self, frame: QImage):
+    @Slot(object)
+    def _on_video_frame_ready(self, frame_and_buffer: tuple):
         if not self._is_video_mode:
             return
+        frame, buffer = frame_and_buffer
         if frame and not frame.isNull():
-            self._picture_base.setImage(frame)
-            self._picture_base.setViewportSize(self.size())
-            self._picture_base.setFitMode(True)
-
-    def _destroy_scrub_player(self):
-        self._scrub_stop = True
-        self._scrub_event.set()
-        if self._scrub_thread and self._scrub_thread.is_alive():
-            self._scrub_thread.join(timeout=2)
+            pb = self._picture_base
+            previous = pb.imageRect()
+            pb.setImage(frame)
+            # why: the frame borrows mpv's screenshot bytes instead of deep-copying
+            # them; keep those alive until the next frame replaces this one.
+            self._scrub_frame_buffer = buffer
+            # No-op (no signal) unless the widget was resized.
+            pb.setViewportSize(self.size())
+            # why: fit zoom depends only on frame and viewport size; refitting on
+            # every same-size scrub frame re-emits viewStateChanged for nothing.
+            if (not pb.isFitMode() or previous.width() != frame.width()
+                    or previous.height() != frame.height()):
+                pb.setFitMode(True)
+            else:
+                self.update()
+
+    def _destroy_scrub_player(self, wait: bool = False):
+        """Stop the scrub worker; it terminates its mpv player on the way out.
+
+        Only closeEvent waits for the thread; the hide path must not block
+        the GUI thread on mpv teardown.
+        """
+        if self._scrub_stop is not None:
+            self._scrub_stop.set()
+            with self._scrub_cond:
+                self._scrub_cond.notify_all()
+        thread = self._scrub_thread
         self._scrub_thread = None
+        if wait and thread is not None and thread.is_alive():
+            thread.join(timeout=2)
 
     def closeEvent(self, event):
         # Signal any in-flight background fetch to discard its result.
         self._fetch_cancelled = True
-        self._destroy_scrub_player()
-        settings = QSettings("RabbitViewer", "Inspector")
-        settings.setValue(f"geometry_{self._inspector_index}", self.saveGeometry())
-        settings.setValue(f"view_mode_{self._inspector_index}", self._view_mode.value)
-        settings.sync()
-        if self.config_manager:
+        self._destroy_scrub_player(wait=True)
+        self._update_timer.stop()
+        self._pending_update = None
+        self._persist_timer.stop()
+        self._fit_decode_timer.stop()
+        idx, geo, mode = self._inspector_index, self.saveGeometry(), self._view_mode.value
+        # why: the shared instance may still hold values staged by
+        # _persist_settings; its lazy sync must not write them back over the
+        # pool thread's newer ones. Staging is in-memory only.
+        settings = self._settings()
+        settings.setValue(f"geometry_{idx}", geo)
+        settings.setValue(f"view_mode_{idx}", mode)
+        # why: saveGeometry must run on the GUI thread, but the disk sync need
+        # not block the window from closing.
+        QThreadPool.globalInstance().start(lambda: _write_settings(idx, geo, mode))
+        self._settings_dirty = False
+        # why: config_manager rewrites its YAML file synchronously and is not
+        # thread-safe; only touch it when the zoom actually changed.
+        if self.config_manager and self._zoom_factor != self._persisted_zoom:
             self.config_manager.set("inspector.zoom_factor", self._zoom_factor)
+            self._persisted_zoom = self._zoom_factor
         self._pinned = False
         event_system.unsubscribe(EventType.INSPECTOR_UPDATE, self._handle_inspector_update)
         if self._daemon_signals:
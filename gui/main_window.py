@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import Optional, Set, List, TYPE_CHECKING
-import threading
+from typing import FrozenSet, Optional, List, TYPE_CHECKING
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QStackedWidget, QApplication, QFileDialog, QMessageBox
-from PySide6.QtCore import Qt, Slot, QPointF, QSize, QPoint, QTimer, QEvent, QObject, Signal, QSettings
+from PySide6.QtCore import Qt, Slot, QPointF, QSize, QPoint, QTimer, QEvent, QObject, Signal, QSettings, QThreadPool
+import enum
 import logging
 import os
 import time
@@ -11,6 +14,7 @@ import time
 from .thumbnail_view import ThumbnailViewWidget
 from .hotkey_manager import HotkeyManager
 from .metadata_cache import MetadataCache
+from .view_image_cache import ViewImageCache
 from .info_panel import InfoPanelShell, MetadataProvider
 from .filter_dialog import FilterDialog
 from .tag_editor_dialog import TagEditorDialog
@@ -24,22 +28,41 @@ from core.selection import SelectionState, SelectionProcessor, SelectionHistory
 from network.socket_client import ThumbnailSocketClient
 from network.gui_server import GuiServer
 from network.daemon_signals import DaemonSignals
+from utils.media_types import is_video
 
+# why: the heavy views are imported inline where first opened. After the
+# first call a repeat import is a sys.modules hit (~0.5 us per window open),
+# and keeping them out of sys.modules until then is what
+# tests/test_startup_lazy_imports.py checks; LazyLoader would register them.
 if TYPE_CHECKING:
     from .inspector_view import InspectorView
     from .picture_view import PictureView
 
-_VIDEO_EXTENSIONS = frozenset([
-    '.mp4', '.mov', '.mkv', '.avi', '.webm', '.m4v',
-    '.wmv', '.flv', '.mpg', '.mpeg', '.3gp', '.ts',
-])
 
+class _ActiveView(enum.Enum):
+    """Which page of MainWindow's stacked widget is showing."""
+    THUMBNAILS = enum.auto()
+    PICTURE = enum.auto()
+    VIDEO = enum.auto()
+
+
+class _HoverTimerMode(enum.Enum):
+    """What MainWindow's hover timer does when it fires."""
+    IDLE = enum.auto()
+    PREFETCH = enum.auto()  # hover settled: status, info panels, prefetch
+    CLEAR = enum.auto()     # cursor left the grid: clear the status bar
+
+
+def _write_geometry(geometry) -> None:
+    """Persist the main window geometry; safe to run off the GUI thread."""
+    # why: QSettings is reentrant, so a private instance may be used from a pool thread.
+    settings = QSettings("RabbitViewer", "MainWindow")
+    settings.setValue("geometry", geometry)
+    settings.sync()
 
-def _is_video(path: str) -> bool:
-    _, ext = os.path.splitext(path)
-    return ext.lower() in _VIDEO_EXTENSIONS
 
 class MainWindow(QMainWindow):
+    # Cross-thread by design: emitted from _hover_pool workers, handled on the GUI thread.
     _hover_rating_ready = Signal(str, int)  # (path, rating)
     _hover_metadata_ready = Signal(str)  # path — emitted after cache populated
     def __init__(self, config_manager, socket_client: ThumbnailSocketClient,
@@ -56,6 +79,10 @@ class MainWindow(QMainWindow):
 
         self.stacked_widget = QStackedWidget()
         self._layout.addWidget(self.stacked_widget)
+        # why: hover, filter and close paths all ask which page is showing;
+        # tracking the stack's page changes avoids a currentWidget() call each time.
+        self._active_view = _ActiveView.THUMBNAILS
+        self.stacked_widget.currentChanged.connect(self._on_stack_changed)
 
         self.status_bar = None
 
@@ -63,10 +90,13 @@ class MainWindow(QMainWindow):
         self.picture_view = None
         self.video_view = None
         self.current_hovered_image = None
-        self.inspector_views: List[InspectorView] = []
+        # why: keyed by id() so a closed window drops out in O(1); insertion
+        # order keeps "most recently opened" for the close cascade.
+        self.inspector_views: OrderedDict[int, InspectorView] = OrderedDict()
         self._inspector_slot = 0
         self.metadata_cache = MetadataCache(self.socket_client)
-        self.info_panels: List[InfoPanelShell] = []
+        self.view_image_cache = ViewImageCache()
+        self.info_panels: OrderedDict[int, InfoPanelShell] = OrderedDict()
         self._info_panel_slot = 0
 
         self._setup_thumbnail_view()
@@ -87,7 +117,7 @@ class MainWindow(QMainWindow):
         self._tag_editor_targets: list = []
         self.tag_filter_dialog = None
         self.comfyui_dialog = None
-        self._removed_images = []
+        self._removed_images: FrozenSet[str] = frozenset()
 
         QTimer.singleShot(0, self._deferred_init)
 
@@ -126,56 +156,87 @@ class MainWindow(QMainWindow):
 
         self._hover_prefetch_path: Optional[str] = None
         self._last_rating_set_time: float = 0.0
-        self._hover_prefetch_timer = QTimer(self)
-        self._hover_prefetch_timer.setSingleShot(True)
-        self._hover_prefetch_timer.setInterval(150)
-        self._hover_prefetch_timer.timeout.connect(self._do_hover_prefetch)
-        self._hover_clear_timer = QTimer(self)
-        self._hover_clear_timer.setSingleShot(True)
-        self._hover_clear_timer.setInterval(100)
-        self._hover_clear_timer.timeout.connect(self._do_hover_clear)
+        # why: hover rating fetches, view-image prefetches and other one-off
+        # daemon requests share two worker threads instead of spawning one
+        # thread per settled hover.
+        self._hover_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hover")
+        self._inflight_hover_future: Optional[Future] = None
+        self._inflight_hover_path: Optional[str] = None
+        # View-image prefetches sent recently (path → monotonic time), oldest first.
+        self._recent_prefetch: OrderedDict[str, float] = OrderedDict()
+        # Hover rating fetches sent recently, same shape as _recent_prefetch.
+        self._recent_rating_fetch: OrderedDict[str, float] = OrderedDict()
+        # +1 after "next", -1 after "previous"; steers neighbour prefetch.
+        self._last_nav_dir = 1
+        # why: settle and clear never need to be pending at once; one timer
+        # with a mode replaces the two that were started and stopped per hover.
+        self._hover_mode = _HoverTimerMode.IDLE
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.timeout.connect(self._on_hover_timer)
+        self._hover_settle_ms = int(self.config_manager.get("gui.hover_settle_ms", self._HOVER_SETTLE_MS))
         self.thumbnail_view.thumbnailHovered.connect(self._on_thumbnail_hovered)
         self.thumbnail_view.thumbnailLeft.connect(self._on_thumbnail_left)
         self.thumbnail_view.filtersApplied.connect(self._on_filters_applied)
-        self._hover_rating_ready.connect(self._on_hover_rating_ready)
-        self._hover_metadata_ready.connect(self._on_hover_metadata_ready)
+        # why: both are emitted from hover-pool threads only; an explicit queued
+        # connection skips AutoConnection's per-emit thread check.
+        self._hover_rating_ready.connect(self._on_hover_rating_ready, Qt.QueuedConnection)
+        self._hover_metadata_ready.connect(self._on_hover_metadata_ready, Qt.QueuedConnection)
 
+    @Slot(str, float)
     def _handle_benchmark_result(self, operation: str, time: float):
         logging.info(f"Benchmark - {operation}: {time:.3f} seconds")
 
+    @Slot(int)
+    def _on_stack_changed(self, _index: int):
+        current = self.stacked_widget.currentWidget()
+        if current is not None and current is self.picture_view:
+            self._active_view = _ActiveView.PICTURE
+        elif current is not None and current is self.video_view:
+            self._active_view = _ActiveView.VIDEO
+        else:
+            self._active_view = _ActiveView.THUMBNAILS
+
     def _is_detail_view_active(self) -> bool:
         """Return True if either picture view or video view is the active widget."""
-        current = self.stacked_widget.currentWidget()
-        return current is self.picture_view or current is self.video_view
+        return self._active_view is not _ActiveView.THUMBNAILS
+
+    _HOVER_SETTLE_MS = 150
+    _HOVER_CLEAR_MS = 100
 
+    @Slot(str)
     def _on_thumbnail_hovered(self, path: str):
         if self._is_detail_view_active():
             return
-        # Cancel any pending clear — cursor moved to another thumbnail
-        self._hover_clear_timer.stop()
-        # Publish filepath immediately — no network needed
-        if path:
-            event_system.publish(StatusMessageEventData(
-                event_type=EventType.STATUS_MESSAGE,
-                source="main_window",
-                timestamp=time.time(),
-                message=path,
-                section=StatusSection.FILEPATH,
-            ))
-        # Notify info panels immediately (reads from cache, may be stale/empty)
-        for panel in self.info_panels:
-            panel.on_thumbnail_hovered(path)
+        # why: sweeps fire this per thumbnail crossed; status bar, info panels
+        # and prefetch all wait for the hover to settle in _do_hover_prefetch.
+        # Restarting the timer also drops a pending clear from the last leave.
         self._hover_prefetch_path = path
-        self._hover_prefetch_timer.start()
+        self._hover_mode = _HoverTimerMode.PREFETCH
+        self._hover_timer.start(self._hover_settle_ms)
 
+    @Slot()
     def _on_thumbnail_left(self):
         if self._is_detail_view_active():
             return
-        for panel in self.info_panels:
+        for panel in self.info_panels.values():
             panel.on_thumbnail_left()
         # Defer clear: if cursor enters another thumbnail within 100 ms the
-        # timer is cancelled in _on_thumbnail_hovered, avoiding flicker.
-        self._hover_clear_timer.start()
+        # timer is re-armed for the settle in _on_thumbnail_hovered, avoiding flicker.
+        self._hover_mode = _HoverTimerMode.CLEAR
+        self._hover_timer.start(self._HOVER_CLEAR_MS)
+
+    @Slot()
+    def _on_hover_timer(self):
+        mode, self._hover_mode = self._hover_mode, _HoverTimerMode.IDLE
+        if mode is _HoverTimerMode.PREFETCH:
+            self._do_hover_prefetch()
+        elif mode is _HoverTimerMode.CLEAR:
+            self._do_hover_clear()
+
+    def _cancel_hover_timer(self):
+        self._hover_timer.stop()
+        self._hover_mode = _HoverTimerMode.IDLE
 
     def _do_hover_clear(self):
         if self.status_bar:
@@ -184,69 +245,175 @@ class MainWindow(QMainWindow):
 
     def _do_hover_prefetch(self):
         path = self._hover_prefetch_path
-        if path:
-            self._prefetch_view_image_async(path)
-            threading.Thread(
-                target=self._fetch_hover_rating, args=(path,), daemon=True
-            ).start()
+        # Superseded or left while the timer ran; a newer hover restarts it.
+        if not path or self.thumbnail_view.get_hovered_image_path() != path:
+            return
+        if not self._is_detail_view_active():
+            # why: MainWindow is the only STATUS_MESSAGE subscriber; like
+            # _do_hover_clear, set the section directly instead of publishing.
+            if self.status_bar:
+                self.status_bar.setFilepath(path)
+            # Info panels read from cache (may be stale/empty until the fetch below).
+            for panel in self.info_panels.values():
+                panel.on_thumbnail_hovered(path)
+        self._prefetch_inspector_neighbors(path)
+        # A fetch still queued for an older hover is no longer wanted. If it
+        # never ran, its view-image warm-up did not go out either.
+        if self._inflight_hover_future is not None:
+            if self._inflight_hover_future.cancel():
+                self._recent_prefetch.pop(self._inflight_hover_path, None)
+            self._inflight_hover_future = None
+        warm_view = bool(self.socket_client) and not self._sent_recently(self._recent_prefetch, path)
+        # why: sweeping back over thumbnails re-hovers the same paths; an entry
+        # fetched within the TTL is still what the daemon would return, since
+        # rating and tag edits invalidate it through forget_metadata.
+        cached = self.metadata_cache.get(path)
+        if self._sent_recently(self._recent_rating_fetch, path) and cached is not None:
+            self._on_hover_rating_ready(path, int(cached.get("rating", 0) or 0))
+            if warm_view:
+                self._hover_pool.submit(self.socket_client.request_view_image, path)
+            return
+        # why: one task per settled hover; the view-image request follows the
+        # rating on the same worker instead of taking the second one.
+        self._inflight_hover_path = path
+        self._inflight_hover_future = self._hover_pool.submit(
+            self._fetch_hover_rating, path, self._uncached_hover_neighbors(path), warm_view)
+
+    _HOVER_METADATA_RADIUS = 2
+
+    def _uncached_hover_neighbors(self, path: str) -> List[str]:
+        """Nearby paths the info panels would render without metadata."""
+        idx = self.thumbnail_view.visible_index_of(path)
+        if idx is None:
+            return []
+        files = self.thumbnail_view.current_files
+        r = self._HOVER_METADATA_RADIUS
+        return [p for p in files[max(0, idx - r):idx] + files[idx + 1:idx + 1 + r]
+                if self.metadata_cache.get(p) is None]
 
-    def _fetch_hover_rating(self, path: str):
+    def _fetch_hover_rating(self, path: str, neighbors: List[str], warm_view: bool = False):
         if not self.socket_client:
             return
         try:
-            result = self.metadata_cache.fetch_and_cache([path])
+            # why: the neighbours ride along in the same round-trip, so the
+            # next settled hover nearby renders from cache instead of waiting.
+            result = self.metadata_cache.fetch_and_cache([path, *neighbors])
             rating = 0
             if path in result:
                 rating = result[path].get("rating", 0) or 0
             self._hover_rating_ready.emit(path, int(rating))
-            self._hover_metadata_ready.emit(path)
+            # why: with no info panel open (the usual case) nobody needs the
+            # refresh, so skip queueing a cross-thread event for it.
+            if self.info_panels:
+                self._hover_metadata_ready.emit(path)
         except Exception as e:
             logging.debug(f"Hover rating fetch failed for {path}: {e}")
+        if warm_view:
+            self.socket_client.request_view_image(path)
+
+    def forget_metadata(self, paths: List[str]):
+        """Drop cached metadata for paths whose rating or tags just changed."""
+        for path in paths:
+            self.metadata_cache.invalidate(path)
 
     def notify_rating_set(self):
         """Record that a rating was just set, suppressing stale hover results."""
         self._last_rating_set_time = time.time()
 
+    @Slot(str, int)
     def _on_hover_rating_ready(self, path: str, rating: int):
         # Skip stale hover results that were in-flight when a rating was just set
         if time.time() - self._last_rating_set_time < 0.5:
             return
-        if self.thumbnail_view.get_hovered_image_path() == path:
-            event_system.publish(StatusMessageEventData(
-                event_type=EventType.STATUS_MESSAGE,
-                source="main_window",
-                timestamp=time.time(),
-                message=str(rating),
-                section=StatusSection.RATING,
-            ))
+        if self.status_bar and self.thumbnail_view.get_hovered_image_path() == path:
+            self.status_bar.setRating(rating)
 
+    @Slot(str)
     def _on_hover_metadata_ready(self, path: str):
         """Refresh info panels after the background fetch populated the cache."""
-        for panel in self.info_panels:
+        for panel in self.info_panels.values():
             panel.refresh_if_showing(path)
 
+    _PREFETCH_TTL = 30.0
+    _PREFETCH_MAX = 256
+
+    def _sent_recently(self, sent: OrderedDict[str, float], path: str) -> bool:
+        """Return True if path was sent within the TTL, else stamp it as sent now."""
+        now = time.monotonic()
+        last = sent.get(path)
+        if last is not None and now - last < self._PREFETCH_TTL:
+            return True
+        sent[path] = now
+        sent.move_to_end(path)
+        while len(sent) > self._PREFETCH_MAX:
+            sent.popitem(last=False)
+        return False
+
     def _prefetch_view_image_async(self, path: str):
         if not self.socket_client or not path:
             return
-        threading.Thread(
-            target=self.socket_client.request_view_image,
-            args=(path,),
-            daemon=True,
-        ).start()
+        # why: back-and-forth navigation re-requests the same neighbours; the
+        # daemon keeps generated view images, so a repeat within the TTL is redundant.
+        if self._sent_recently(self._recent_prefetch, path):
+            return
+        self._hover_pool.submit(self._warm_view_image, path)
+
+    def _warm_view_image(self, path: str):
+        """Queue the view image and, if the daemon holds it in memory, keep its bytes."""
+        # why: only navigation neighbours come through here, so pulling the
+        # bytes now makes the likely next open a local lookup.
+        result = self.socket_client.request_view_image(path)
+        if result is None or result.status != "success" or result.view_image_source != "memory":
+            return
+        image_bytes = self.socket_client.get_cached_view_image(path)
+        if image_bytes:
+            self.view_image_cache.put(path, image_bytes)
+
+    _INSPECTOR_PREFETCH_RADIUS = 8
+
+    def _prefetch_inspector_neighbors(self, image_path: str):
+        """Warm view images around a dwelled-on thumbnail while an inspector is open."""
+        inspector = next((v for v in self.inspector_views.values() if v.isVisible()), None)
+        if inspector is None:
+            return
+        files = self.thumbnail_view.current_files
+        idx = self.thumbnail_view.visible_index_of(image_path)
+        if idx is None:
+            return
+        r = self._INSPECTOR_PREFETCH_RADIUS
+        inspector.prefetch_neighbors(files[max(0, idx - r):idx] + files[idx + 1:idx + 1 + r],
+                                     self._hover_pool)
+
+    _NEIGHBOR_SCAN_LIMIT = 16
+    _NAV_PREFETCH_AHEAD = 3
 
     def _prefetch_neighbors(self, image_path: str):
+        """Warm the next stills in the browsing direction and the nearest one behind."""
         files = self.thumbnail_view.current_files
         if not files:
             return
-        try:
-            idx = files.index(image_path)
-        except ValueError:
+        idx = self.thumbnail_view.visible_index_of(image_path)
+        if idx is None:
             return
+        ahead = self._nearest_stills(files, idx, self._last_nav_dir, self._NAV_PREFETCH_AHEAD)
+        behind = self._nearest_stills(files, idx, -self._last_nav_dir, 1)
+        # why: the pool runs tasks in submit order, so the image the next key
+        # press opens goes first and the step back second.
+        for neighbor in ahead[:1] + behind + ahead[1:]:
+            self._prefetch_view_image_async(neighbor)
+
+    def _nearest_stills(self, files: List[str], idx: int, step: int, count: int) -> List[str]:
+        # why: a video has no view image; step past it so the slot still warms
+        # the picture navigation reaches after the video.
         n = len(files)
-        for neighbor_idx in {(idx - 1) % n, (idx + 1) % n} - {idx}:
-            neighbor = files[neighbor_idx]
-            if not _is_video(neighbor):
-                self._prefetch_view_image_async(neighbor)
+        found = []
+        for offset in range(1, min(n - 1, self._NEIGHBOR_SCAN_LIMIT) + 1):
+            neighbor = files[(idx + step * offset) % n]
+            if not is_video(neighbor):
+                found.append(neighbor)
+                if len(found) == count:
+                    break
+        return found
 
     def _open_inspector_window(self):
         """Create and show a new inspector window."""
@@ -255,17 +422,15 @@ class MainWindow(QMainWindow):
         self._inspector_slot += 1
         inspector.set_socket_client(self.socket_client)
         inspector.set_daemon_signals(self.daemon_signals)
-        self.inspector_views.append(inspector)
+        self.inspector_views[id(inspector)] = inspector
         inspector.closed.connect(lambda: self._on_inspector_closed(inspector))
         inspector.show()
-        if self.picture_view and self.stacked_widget.currentWidget() == self.picture_view:
+        if self.picture_view and self._active_view is _ActiveView.PICTURE:
             self._force_inspector_update_from_picture_view()
         logging.info("Opened new Inspector window.")
 
     def _on_inspector_closed(self, inspector):
-        try:
-            self.inspector_views.remove(inspector)
-        except ValueError:
+        if self.inspector_views.pop(id(inspector), None) is None:
             return  # already removed by closeEvent teardown loop
         if not self.inspector_views:
             self._inspector_slot = 0
@@ -273,7 +438,7 @@ class MainWindow(QMainWindow):
     def _pin_last_inspector(self):
         """Toggle pin on the most recently created inspector view."""
         if self.inspector_views:
-            self.inspector_views[-1].toggle_pin()
+            next(reversed(self.inspector_views.values())).toggle_pin()
 
     def _open_info_panel(self):
         """Create and show a new metadata info panel."""
@@ -282,15 +447,13 @@ class MainWindow(QMainWindow):
                                panel_index=self._info_panel_slot,
                                config_manager=self.config_manager)
         self._info_panel_slot += 1
-        self.info_panels.append(panel)
+        self.info_panels[id(panel)] = panel
         panel.closed.connect(lambda: self._on_info_panel_closed(panel))
         panel.show()
         logging.info("Opened new Info panel.")
 
     def _on_info_panel_closed(self, panel):
-        try:
-            self.info_panels.remove(panel)
-        except ValueError:
+        if self.info_panels.pop(id(panel), None) is None:
             return
         if not self.info_panels:
             self._info_panel_slot = 0
@@ -359,7 +522,7 @@ class MainWindow(QMainWindow):
 
     def get_effective_selection(self) -> list:
         """Return selected image paths, falling back to the hovered image."""
-        if self.picture_view and self.stacked_widget.currentWidget() is self.picture_view:
+        if self.picture_view and self._active_view is _ActiveView.PICTURE:
             path = self.picture_view.current_path
             return [path] if path else []
 
@@ -391,8 +554,15 @@ class MainWindow(QMainWindow):
 
         # Intersection of tags across all selected images
         if existing_resp and existing_resp.status == "success" and existing_resp.tags:
-            tag_sets = [set(v) for v in existing_resp.tags.values()]
-            common_tags = sorted(set.intersection(*tag_sets)) if tag_sets else []
+            # why: narrow one running set in place and stop once it is empty,
+            # rather than building a set per selected image up front.
+            per_image = iter(existing_resp.tags.values())
+            common = set(next(per_image))
+            for tags in per_image:
+                if not common:
+                    break
+                common.intersection_update(tags)
+            common_tags = sorted(common)
         else:
             common_tags = []
 
@@ -414,6 +584,7 @@ class MainWindow(QMainWindow):
             sc.set_tags(selected, tags_to_add)
         if tags_to_remove:
             sc.remove_tags(selected, tags_to_remove)
+        self.forget_metadata(selected)
         # Reapply filters in case tag filter is active
         if self.thumbnail_view.has_active_tag_filter():
             self.thumbnail_view.reapply_filters()
@@ -446,26 +617,28 @@ class MainWindow(QMainWindow):
             else:
                 logging.warning(f"ComfyUI generate returned no task_id: {resp!r}")
 
-        threading.Thread(target=_send, daemon=True).start()
+        self._hover_pool.submit(_send)
 
+    @Slot()
     def _on_filters_applied(self):
         """After filter re-applies, refresh UI state for the currently active media."""
         # Case 1: detail view is open — navigate away if current media is now filtered out
         current_path = None
         active_view = None
-        if self.picture_view and self.stacked_widget.currentWidget() is self.picture_view:
+        if self.picture_view and self._active_view is _ActiveView.PICTURE:
             active_view = "picture"
             current_path = self.picture_view.current_path
-        elif self.video_view and self.stacked_widget.currentWidget() is self.video_view:
+        elif self.video_view and self._active_view is _ActiveView.VIDEO:
             active_view = "video"
             current_path = self.video_view.current_path
 
         if active_view and current_path:
-            visible = set(self.thumbnail_view.current_files)
-            if current_path not in visible:
-                if visible:
-                    first = self.thumbnail_view.current_files[0]
-                    self._open_media_view(first)
+            # why: the view's path index is rebuilt with current_files, so this
+            # is O(1) instead of building a set of the whole directory.
+            if self.thumbnail_view.visible_index_of(current_path) is None:
+                files = self.thumbnail_view.current_files
+                if files:
+                    self._open_media_view(files[0])
                 else:
                     if active_view == "picture":
                         self.close_picture_view()
@@ -532,8 +705,9 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handles the window close event."""
         logging.info("GUI close requested.")
-        self._hover_clear_timer.stop()
-        self._hover_prefetch_timer.stop()
+        self._cancel_hover_timer()
+        # wait=False: queued hover work is best-effort and must not delay shutdown.
+        self._hover_pool.shutdown(wait=False, cancel_futures=True)
 
         if self.video_view:
             self.video_view.close()
@@ -543,18 +717,19 @@ class MainWindow(QMainWindow):
             self._gui_server.stop()
 
         # Close any other windows like inspectors and info panels
-        for inspector in list(self.inspector_views):
+        for inspector in list(self.inspector_views.values()):
             inspector.close()
         self.inspector_views.clear()
-        for panel in list(self.info_panels):
+        for panel in list(self.info_panels.values()):
             panel.close()
         self.info_panels.clear()
         if self.comfyui_dialog:
             self.comfyui_dialog.close()
             self.comfyui_dialog = None
-        settings = QSettings("RabbitViewer", "MainWindow")
-        settings.setValue("geometry", self.saveGeometry())
-        settings.sync()
+        geometry = self.saveGeometry()
+        # why: saveGeometry must run on the GUI thread, but the disk write need
+        # not hold up shutdown; the global pool is drained before the app exits.
+        QThreadPool.globalInstance().start(lambda: _write_geometry(geometry))
         event.accept()
         QApplication.instance().quit()
 
@@ -595,8 +770,8 @@ class MainWindow(QMainWindow):
         self.hotkey_manager.add_action("pin_inspector", self._pin_last_inspector)
         self.hotkey_manager.add_action("escape_picture_view", self._close_active_media_view)
         self.hotkey_manager.add_action("close_or_quit", self._handle_close_or_quit)
-        self.hotkey_manager.add_action("next_image", lambda: self.navigate_to_image("next"))
-        self.hotkey_manager.add_action("previous_image", lambda: self.navigate_to_image("previous"))
+        self.hotkey_manager.add_action("next_image", partial(self.navigate_to_image, "next"))
+        self.hotkey_manager.add_action("previous_image", partial(self.navigate_to_image, "previous"))
         self.hotkey_manager.add_action("undo_selection", self.selection_history.undo)
         self.hotkey_manager.add_action("redo_selection", self.selection_history.redo)
         self.hotkey_manager.add_action("show_hotkey_help", self._toggle_hotkey_help)
@@ -622,27 +797,28 @@ class MainWindow(QMainWindow):
         self.stacked_widget.setCurrentWidget(self.thumbnail_view)
         logging.info("MainWindow: ThumbnailView is now the current widget")
 
-    def get_removed_images(self) -> Set[str]:
-        return set(self._removed_images)
+    def get_removed_images(self) -> FrozenSet[str]:
+        # why: immutable, so the set built in remove_images is handed out as-is.
+        return self._removed_images
 
     def remove_images(self, image_paths: List[str]):
         """Remove images from the thumbnail view and update active media view."""
         if not self.thumbnail_view:
             return
-        removed_set = set(image_paths)
+        removed_set = frozenset(image_paths)
 
         # Determine if the active media view is showing a removed image.
         current_path = None
         active_view = None
-        if self.picture_view and self.stacked_widget.currentWidget() is self.picture_view:
+        if self.picture_view and self._active_view is _ActiveView.PICTURE:
             active_view = "picture"
             current_path = self.picture_view.current_path
-        elif self.video_view and self.stacked_widget.currentWidget() is self.video_view:
+        elif self.video_view and self._active_view is _ActiveView.VIDEO:
             active_view = "video"
             current_path = self.video_view.current_path
 
         self.thumbnail_view.remove_images(image_paths)
-        self._removed_images = image_paths.copy()
+        self._removed_images = removed_set
 
         # If the active media view was showing a removed image, navigate or close.
         if active_view and current_path and current_path in removed_set:
@@ -665,10 +841,12 @@ class MainWindow(QMainWindow):
 
     def _open_media_view(self, file_path: str):
         """Route to PictureView or VideoView based on file type."""
+        # why: the one stat() on the open path; neither view fails on a missing
+        # file by itself (the daemon would just queue a view image).
         if not os.path.exists(file_path):
             logging.error(f"File does not exist: {file_path}")
             return
-        if _is_video(file_path):
+        if is_video(file_path):
             self._open_video_view(file_path)
         else:
             self._open_picture_view(file_path)
@@ -676,7 +854,7 @@ class MainWindow(QMainWindow):
     def _open_video_view(self, video_path: str):
         """Open a video in the embedded mpv player."""
         # Close picture view if it's open (switching media types).
-        if self.picture_view and self.stacked_widget.currentWidget() is self.picture_view:
+        if self.picture_view and self._active_view is _ActiveView.PICTURE:
             self.picture_view.close()
             self.picture_view = None
         try:
@@ -687,18 +865,16 @@ class MainWindow(QMainWindow):
                 self.video_view.set_socket_client(self.socket_client)
                 self.stacked_widget.addWidget(self.video_view)
             self.video_view.loadVideo(video_path)
-            self._hover_clear_timer.stop()
+            self._cancel_hover_timer()
             self.stacked_widget.setCurrentWidget(self.video_view)
             self.video_view.setFocus()
         except Exception as e:
             logging.error(f"Failed to open video view: {e}", exc_info=True)
 
     def _open_picture_view(self, image_path: str):
-        if not os.path.exists(image_path):
-            logging.error(f"Original file does not exist: {image_path}")
-            return
+        """Show *image_path* in PictureView; callers go through _open_media_view."""
         # Close video view if switching from video to image.
-        if self.video_view and self.stacked_widget.currentWidget() is self.video_view:
+        if self.video_view and self._active_view is _ActiveView.VIDEO:
             self.video_view.close()
             self.video_view = None
         try:
@@ -707,11 +883,13 @@ class MainWindow(QMainWindow):
                 self.picture_view = PictureView()
                 self.picture_view.escapePressed.connect(self.close_picture_view)
                 self.picture_view.set_socket_client(self.socket_client)
+                self.picture_view.set_executor(self._hover_pool)
+                self.picture_view.set_view_image_cache(self.view_image_cache)
                 self.picture_view.set_daemon_signals(self.daemon_signals)
                 self.stacked_widget.addWidget(self.picture_view)
             self.picture_view.loadImage(image_path)
             self._prefetch_neighbors(image_path)
-            self._hover_clear_timer.stop()
+            self._cancel_hover_timer()
             self.stacked_widget.setCurrentWidget(self.picture_view)
             self.picture_view.setFocus()
         except Exception as e:  # why: loadImage delegates to format plugins which may raise arbitrarily
@@ -719,22 +897,22 @@ class MainWindow(QMainWindow):
             
     def _handle_close_or_quit(self):
         """Cascade: close media view → close last inspector → close last info panel → quit."""
-        if self.picture_view and self.stacked_widget.currentWidget() is self.picture_view:
+        if self.picture_view and self._active_view is _ActiveView.PICTURE:
             self.close_picture_view()
-        elif self.video_view and self.stacked_widget.currentWidget() is self.video_view:
+        elif self.video_view and self._active_view is _ActiveView.VIDEO:
             self.close_video_view()
         elif self.inspector_views:
-            self.inspector_views[-1].close()
+            next(reversed(self.inspector_views.values())).close()
         elif self.info_panels:
-            self.info_panels[-1].close()
+            next(reversed(self.info_panels.values())).close()
         else:
             self.close()
 
     def _close_active_media_view(self):
         """Close whichever media view is active."""
-        if self.picture_view and self.stacked_widget.currentWidget() is self.picture_view:
+        if self.picture_view and self._active_view is _ActiveView.PICTURE:
             self.close_picture_view()
-        elif self.video_view and self.stacked_widget.currentWidget() is self.video_view:
+        elif self.video_view and self._active_view is _ActiveView.VIDEO:
             self.close_video_view()
 
     def close_picture_view(self):
@@ -768,34 +946,34 @@ class MainWindow(QMainWindow):
         except RuntimeError as e:
             logging.error(f"Error closing video view: {e}", exc_info=True)
 
+    def _active_media_view(self):
+        """The picture or video view on screen, or None in the thumbnail grid."""
+        if self._active_view is _ActiveView.PICTURE:
+            return self.picture_view
+        if self._active_view is _ActiveView.VIDEO:
+            return self.video_view
+        return None
+
     def navigate_to_image(self, direction: str):
         """Navigate to next/previous media in the current view."""
-        # Get current path from whichever view is active.
-        current_path = None
-        if self.picture_view and self.stacked_widget.currentWidget() is self.picture_view:
-            current_path = self.picture_view.current_path
-        elif self.video_view and self.stacked_widget.currentWidget() is self.video_view:
-            current_path = self.video_view.current_path
-
+        if direction == "next":
+            step = 1
+        elif direction == "previous":
+            step = -1
+        else:
+            return
+        view = self._active_media_view()
+        current_path = view.current_path if view else None
         if not current_path:
             return
 
         try:
-            try:
-                current_idx = self.thumbnail_view.current_files.index(current_path)
-            except ValueError:
+            files = self.thumbnail_view.current_files
+            current_idx = self.thumbnail_view.visible_index_of(current_path)
+            if current_idx is None or not files:
                 logging.warning(f"Current media {current_path} not found in visible files")
                 return
-            num_visible = len(self.thumbnail_view.current_files)
-            if num_visible == 0:
-                return
-            if direction == "next":
-                new_idx = (current_idx + 1) % num_visible
-            elif direction == "previous":
-                new_idx = (current_idx - 1 + num_visible) % num_visible
-            else:
-                return
-            new_path = self.thumbnail_view.current_files[new_idx]
-            self._open_media_view(new_path)
+            self._last_nav_dir = step
+            self._open_media_view(files[(current_idx + step) % len(files)])
         except Exception as e:  # why: loadImage delegates to format plugins which may raise arbitrarily
             logging.error(f"Error navigating to {direction} media: {e}", exc_info=True)
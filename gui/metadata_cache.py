@@ -1,9 +1,33 @@
 import logging
 import threading
+from datetime import datetime
 from typing import Dict, Optional, List
 from collections import OrderedDict
 
 
+def add_display_fields(meta: dict) -> dict:
+    """Precompute the formatted strings shown by the info panel, in place.
+
+    Adds ``_formatted_size``, ``_formatted_date`` and ``_rating_stars``
+    (None when the source field is absent or zero) and returns meta.
+    """
+    file_size = meta.get("file_size")
+    meta["_formatted_size"] = f"{file_size / (1024 * 1024):.1f} MB" if file_size else None
+
+    rating = meta.get("rating")
+    meta["_rating_stars"] = "\u2605" * int(rating) if rating else None
+
+    date_taken = meta.get("date_taken")
+    if date_taken is None:
+        meta["_formatted_date"] = None
+    else:
+        try:
+            meta["_formatted_date"] = datetime.fromtimestamp(float(date_taken)).strftime("%Y-%m-%d %H:%M:%S")
+        except (ValueError, TypeError, OSError):
+            meta["_formatted_date"] = str(date_taken)
+    return meta
+
+
 class MetadataCache:
     """Client-side LRU cache for image metadata fetched from the daemon.
 
@@ -16,6 +40,9 @@ class MetadataCache:
     def __init__(self, socket_client):
         self._socket_client = socket_client
         self._cache: OrderedDict[str, dict] = OrderedDict()
+        # Per-path write counter so consumers can memoize derived data.
+        self._versions: Dict[str, int] = {}
+        self._version_counter = 0
         self._lock = threading.Lock()
 
     def get(self, path: str) -> Optional[dict]:
@@ -26,24 +53,48 @@ class MetadataCache:
                 return self._cache[path]
         return None
 
+    def version_for(self, path: str) -> int:
+        """Return a counter that changes whenever path's entry changes.
+
+        0 means the path is not cached.
+        """
+        with self._lock:
+            return self._versions.get(path, 0)
+
     def put(self, path: str, metadata: dict) -> None:
         with self._lock:
-            self._cache[path] = metadata
-            self._cache.move_to_end(path)
-            while len(self._cache) > self.MAX_ENTRIES:
-                self._cache.popitem(last=False)
+            self._store(path, metadata)
+            self._evict()
 
     def put_batch(self, metadata_map: Dict[str, dict]) -> None:
         with self._lock:
             for path, meta in metadata_map.items():
-                self._cache[path] = meta
-                self._cache.move_to_end(path)
-            while len(self._cache) > self.MAX_ENTRIES:
-                self._cache.popitem(last=False)
+                self._store(path, meta)
+            self._evict()
 
     def invalidate(self, path: str) -> None:
         with self._lock:
             self._cache.pop(path, None)
+            self._versions.pop(path, None)
+
+    def _store(self, path: str, metadata: dict) -> None:
+        """Caller must hold self._lock."""
+        metadata = add_display_fields(metadata)
+        # why: every settled hover re-puts the same metadata; bumping the
+        # version then would defeat consumers' per-version memoization.
+        if self._cache.get(path) == metadata:
+            self._cache.move_to_end(path)
+            return
+        self._cache[path] = metadata
+        self._cache.move_to_end(path)
+        self._version_counter += 1
+        self._versions[path] = self._version_counter
+
+    def _evict(self) -> None:
+        """Caller must hold self._lock."""
+        while len(self._cache) > self.MAX_ENTRIES:
+            evicted, _ = self._cache.popitem(last=False)
+            self._versions.pop(evicted, None)
 
     def fetch_and_cache(self, paths: List[str]) -> Dict[str, dict]:
         """Fetch from daemon, populate cache, return results.
@@ -110,8 +110,8 @@ class ModalMenu(QWidget):
         if not self._is_open:
             self._is_open = True
             # why: eventFilter installed on QApplication intercepts keys before
-            # QShortcut matching and before HotkeyManager's own eventFilter,
-            # because Qt calls filters in reverse installation order (LIFO).
+            # QShortcut matching and before any widget-level filter (such as
+            # HotkeyManager's on the main window).
             app = QApplication.instance()
             if app:
                 app.installEventFilter(self)
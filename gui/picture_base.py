@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import Optional
-from PySide6.QtCore import QObject, Signal, QPointF, QSizeF, QRectF
-from PySide6.QtGui import QImage, QTransform
+from typing import Optional, Tuple
+from PySide6.QtCore import Qt, QObject, Signal, QPointF, QSize, QSizeF, QRectF
+from PySide6.QtGui import QImage, QImageReader, QPixmap, QTransform
 import logging
 from core.event_system import event_system, EventType, ZoomEventData, ZoomDragEventData, DoubleClickZoomEventData
 import time
@@ -28,6 +28,10 @@ class PictureBase(QObject):
     def __init__(self):
         super().__init__()
         self._image: Optional[QImage] = None
+        # Native-format copy of _image for painting; built on first get_pixmap().
+        self._pixmap: Optional[QPixmap] = None
+        # True when loadImageFromPath decoded _image below its native size.
+        self._decode_scaled = False
         self._view_state = ViewState(
             center=QPointF(0.5, 0.5),  # Start at center
             zoom=1.0,
@@ -43,6 +47,11 @@ class PictureBase(QObject):
 
         self._cached_transform: Optional[QTransform] = None
         self._transform_dirty = True
+        # (inverse, invertible) of _cached_transform; dropped whenever it is rebuilt.
+        self._cached_inverse: Optional[Tuple[QTransform, bool]] = None
+        # Bumped when zoom, viewport or image geometry change; pure pans leave
+        # it alone because they only move the translation part of the transform.
+        self._scale_version = 0
 
         self._setup_event_subscriptions()
 
@@ -142,16 +151,39 @@ class PictureBase(QObject):
     def get_image(self) -> Optional[QImage]:
         return self._image if self.has_image() else None
 
+    def get_pixmap(self) -> Optional[QPixmap]:
+        """Return the current image as a QPixmap, converting it once per image."""
+        if not self.has_image():
+            return None
+        if self._pixmap is None:
+            self._pixmap = QPixmap.fromImage(self._image)
+        return self._pixmap
+
     def setImage(self, image: QImage) -> None:
         self._image = image
+        self._pixmap = None
+        self._decode_scaled = False
         if image and not image.isNull():
             self._updatePaddingRect()
             self.imageLoaded.emit()
             
-    def loadImageFromPath(self, path_to_load: str) -> bool:
-        image = QImage(path_to_load)
+    def loadImageFromPath(self, path_to_load: str, max_size: Optional[QSize] = None) -> bool:
+        """Decode path_to_load; if max_size is given, decode no larger than it.
+
+        Scaled decoding lets formats such as JPEG skip work in the decoder
+        itself (DCT scaling) instead of downsampling a full-size image.
+        """
+        reader = QImageReader(path_to_load)
+        scaled = False
+        if max_size is not None:
+            full = reader.size()
+            if full.isValid() and (full.width() > max_size.width() or full.height() > max_size.height()):
+                reader.setScaledSize(full.scaled(max_size, Qt.KeepAspectRatio))
+                scaled = True
+        image = reader.read()
         if not image.isNull():
             self.setImage(image)
+            self._decode_scaled = scaled
             logging.debug("Loaded image: %s", path_to_load)
             return True
         return False
@@ -178,6 +210,7 @@ class PictureBase(QObject):
             square_size, square_size
         )
         self._transform_dirty = True
+        self._scale_version += 1
         
     
     def screenToNormalized(self, screen_pos: QPointF) -> QPointF:
@@ -185,8 +218,7 @@ class PictureBase(QObject):
         if not self._image or self.viewportSize().isEmpty():
             return QPointF()
 
-        transform = self.calculateTransform()
-        inv_transform, invertible = transform.inverted()
+        inv_transform, invertible = self.cachedInverseTransform()
         if not invertible:
             return QPointF()
         padded_space_pos = inv_transform.map(screen_pos)
@@ -216,6 +248,7 @@ class PictureBase(QObject):
             return self._cached_transform
 
         transform = QTransform()
+        self._cached_inverse = None
 
         if not self._image or self.viewportSize().isEmpty():
             self._cached_transform = transform
@@ -233,6 +266,20 @@ class PictureBase(QObject):
         self._transform_dirty = False
         return transform
         
+    def cachedInverseTransform(self) -> Tuple[QTransform, bool]:
+        """Return ``calculateTransform().inverted()``, memoized with the transform."""
+        transform = self.calculateTransform()
+        if self._cached_inverse is None:
+            # why: the view transform only scales and translates, so its inverse
+            # is closed-form; no general 3x3 inversion per center change.
+            sx, sy = transform.m11(), transform.m22()
+            if sx and sy:
+                self._cached_inverse = (QTransform(1.0 / sx, 0.0, 0.0, 1.0 / sy,
+                                                   -transform.dx() / sx, -transform.dy() / sy), True)
+            else:
+                self._cached_inverse = (QTransform(), False)
+        return self._cached_inverse
+
     def setZoom(self, zoom: float, center: Optional[QPointF] = None) -> None:
         """Set the zoom level and optionally the center point."""
         if zoom <= 0:
@@ -244,6 +291,7 @@ class PictureBase(QObject):
             self._view_state.center = center
         self._view_state.fit_mode = False
         self._transform_dirty = True
+        self._scale_version += 1
 
         self.viewStateChanged.emit(self._view_state)
 
@@ -257,6 +305,16 @@ class PictureBase(QObject):
         self._transform_dirty = True
         self.viewStateChanged.emit(self._view_state)
 
+    def setCenterXY(self, x: float, y: float) -> None:
+        """Scalar form of setCenter for hot paths that already hold plain floats."""
+        current = self._view_state.center
+        if x == current.x() and y == current.y():
+            return
+        self._view_state.center = QPointF(x, y)
+        self._view_state.fit_mode = False
+        self._transform_dirty = True
+        self.viewStateChanged.emit(self._view_state)
+
     def setViewportSize(self, size: QSizeF) -> None:
         """Update the viewport size."""
         if size != self._view_state.viewport_size:
@@ -265,11 +323,16 @@ class PictureBase(QObject):
                 self._view_state.zoom = self.calculateFitZoom()
                 self._view_state.center = QPointF(0.5, 0.5)
             self._transform_dirty = True
+            self._scale_version += 1
             self.viewStateChanged.emit(self._view_state)
             
     def viewState(self) -> ViewState:
         """Get the current view state."""
         return self._view_state
+
+    def scaleVersion(self) -> int:
+        """Counter that changes whenever the linear part of the transform may have."""
+        return self._scale_version
         
     def viewportSize(self) -> QSizeF:
         """Get the current viewport size."""
@@ -305,6 +368,7 @@ class PictureBase(QObject):
             self._view_state.zoom = self.calculateFitZoom()
             self._view_state.center = QPointF(0.5, 0.5)
         self._transform_dirty = True
+        self._scale_version += 1
         self.viewStateChanged.emit(self._view_state)
     
     def isFitMode(self) -> bool:
@@ -418,6 +482,10 @@ class PictureBase(QObject):
         new_zoom = self._drag_zoom_initial_zoom * (1.0 + adjusted_delta / 100.0)
         return new_zoom if new_zoom > 0 else None
 
+    def isDecodeScaled(self) -> bool:
+        """Check if the current image was decoded below its native size."""
+        return self._decode_scaled
+
     def isDragZooming(self) -> bool:
         """Check if currently drag zooming."""
         return self._is_drag_zooming
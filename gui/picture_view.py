@@ -5,8 +5,10 @@ from PySide6.QtGui import QPainter, QImage, QMouseEvent, QPaintEvent, QResizeEve
 import logging
 import os
 import time
-import threading
+from concurrent.futures import Executor, Future
+from typing import Optional
 from .picture_base import PictureBase
+from .view_image_cache import ViewImageCache
 from core.event_system import event_system, EventType, InspectorEventData, StatusMessageEventData, StatusSection
 from network.daemon_signals import DaemonSignals
 from network.protocol import PreviewsReadyData
@@ -38,10 +40,20 @@ class PictureView(QWidget):
         self._last_mouse_pos = QPoint()
 
         self.socket_client = None # Will be set by main window
+        # Background executor for daemon lookups; set by main window.
+        self._executor: Optional[Executor] = None
+        self._rating_future: Optional[Future] = None
+        self._view_image_cache: Optional[ViewImageCache] = None
 
     def set_socket_client(self, socket_client: ThumbnailSocketClient):
         self.socket_client = socket_client
 
+    def set_executor(self, executor: Executor):
+        self._executor = executor
+
+    def set_view_image_cache(self, cache: ViewImageCache):
+        self._view_image_cache = cache
+
     def keyPressEvent(self, event: QKeyEvent) -> None:
         if event.key() == Qt.Key_Escape:
             self.escapePressed.emit()
@@ -79,41 +91,51 @@ class PictureView(QWidget):
             logging.error("Socket client not initialized in PictureView.")
             return False
         
-        # Request the view image at FULLRES_REQUEST priority. Always returns JSON.
-        # view_image_source="memory" → bytes available via get_cached_view_image.
-        # view_image_path set → disk-cached. Neither → generation queued.
-        result = self.socket_client.request_view_image(image_path)
+        # why: a neighbour prefetch or an earlier visit may already hold the
+        # bytes; a forced reload means the daemon has regenerated them.
+        cached = None
+        if self._view_image_cache is not None and not force_reload:
+            cached = self._view_image_cache.get(image_path)
+        if cached is not None and self._picture_base.loadImageFromBytes(cached):
+            success = True
+        else:
+            # Request the view image at FULLRES_REQUEST priority. Always returns JSON.
+            # view_image_source="memory" → bytes available via get_cached_view_image.
+            # view_image_path set → disk-cached. Neither → generation queued.
+            result = self.socket_client.request_view_image(image_path)
 
-        if result is None or result.status != "success":
-            logging.error(f"Failed to request view image: {image_path}")
-            return False
+            if result is None or result.status != "success":
+                logging.error(f"Failed to request view image: {image_path}")
+                return False
 
-        if result.view_image_source == "memory":
-            # Mem-cached on daemon — fetch raw bytes via dedicated call.
-            image_bytes = self.socket_client.get_cached_view_image(image_path)
-            success = self._picture_base.loadImageFromBytes(image_bytes) if image_bytes else False
-        elif result.view_image_path:
-            # Disk-cached — load from path.
-            success = self._picture_base.loadImageFromPath(result.view_image_path)
-        else:
-            # Generation queued — show placeholder and wait for previews_ready notification.
-            self._picture_base.setImage(QImage())  # Clear the view
-            self._current_path = image_path  # Set path so notification handler knows what to load
-            event_system.publish(StatusMessageEventData(
-                event_type=EventType.STATUS_MESSAGE,
-                source="picture_view",
-                timestamp=time.time(),
-                message=image_path,
-                section=StatusSection.FILEPATH,
-            ))
-            event_system.publish(StatusMessageEventData(
-                event_type=EventType.STATUS_MESSAGE,
-                source="picture_view",
-                timestamp=time.time(),
-                message=f"Generating preview for {os.path.basename(image_path)}...",
-                section=StatusSection.PROCESS,
-            ))
-            return False  # Indicate loading is in progress
+            if result.view_image_source == "memory":
+                # Mem-cached on daemon — fetch raw bytes via dedicated call.
+                image_bytes = self.socket_client.get_cached_view_image(image_path)
+                success = self._picture_base.loadImageFromBytes(image_bytes) if image_bytes else False
+                if success and self._view_image_cache is not None:
+                    self._view_image_cache.put(image_path, image_bytes)
+            elif result.view_image_path:
+                # Disk-cached — load from path.
+                success = self._picture_base.loadImageFromPath(result.view_image_path)
+            else:
+                # Generation queued — show placeholder and wait for previews_ready notification.
+                self._picture_base.setImage(QImage())  # Clear the view
+                self._current_path = image_path  # Set path so notification handler knows what to load
+                event_system.publish(StatusMessageEventData(
+                    event_type=EventType.STATUS_MESSAGE,
+                    source="picture_view",
+                    timestamp=time.time(),
+                    message=image_path,
+                    section=StatusSection.FILEPATH,
+                ))
+                event_system.publish(StatusMessageEventData(
+                    event_type=EventType.STATUS_MESSAGE,
+                    source="picture_view",
+                    timestamp=time.time(),
+                    message=f"Generating preview for {os.path.basename(image_path)}...",
+                    section=StatusSection.PROCESS,
+                ))
+                return False  # Indicate loading is in progress
 
         if success:
             self._current_path = image_path  # Store original path for navigation and external use
@@ -129,9 +151,12 @@ class PictureView(QWidget):
             ))
 
             # Fetch rating off the GUI thread to avoid blocking on slow daemon responses
-            threading.Thread(
-                target=self._fetch_rating, args=(image_path,), daemon=True
-            ).start()
+            if self._executor is not None:
+                # why: fast navigation queues one fetch per image; only the
+                # newest one's result would still be shown.
+                if self._rating_future is not None:
+                    self._rating_future.cancel()
+                self._rating_future = self._executor.submit(self._fetch_rating, image_path)
             
             # Always start in fit mode for new images
             self._picture_base.setFitMode(True)
@@ -164,7 +189,7 @@ class PictureView(QWidget):
         return self._current_path
 
     def _fetch_rating(self, path: str):
-        """Fetch rating from daemon in a background thread and marshal result to main thread."""
+        """Fetch rating from daemon on the executor and marshal result to main thread."""
         rating = 0
         if self.socket_client:
             try:
@@ -195,6 +220,8 @@ class PictureView(QWidget):
     def _on_previews_ready(self, data: PreviewsReadyData) -> None:
         # If this is the image we are waiting for, load it.
         view_ready = data.view_image_path or data.view_image_source == "memory"
+        if view_ready and self._view_image_cache is not None:
+            self._view_image_cache.invalidate(data.image_entry.path)
         if view_ready and data.image_entry.path == self._current_path:
             logging.info(f"Loading newly generated view image via notification: {data.image_entry.path}")
             self.loadImage(data.image_entry.path, force_reload=True)
@@ -224,8 +251,9 @@ class PictureView(QWidget):
             delta = event.position().toPoint() - self._last_mouse_pos
             self._last_mouse_pos = event.position().toPoint()
             
-            transform = self._picture_base.calculateTransform()
-            inv_transform, invertible = transform.inverted()
+            # why: _updateInspector above normally inverted this same transform via
+            # screenToNormalized; reuse the memoized result instead of inverting again.
+            inv_transform, invertible = self._picture_base.cachedInverseTransform()
             if invertible:
                 delta_normalized = inv_transform.map(QPointF(delta)) - inv_transform.map(QPointF(0, 0))
                 
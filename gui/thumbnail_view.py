@@ -1750,6 +1750,15 @@ class ThumbnailViewWidget(QFrame):
     def get_visible_count(self) -> int:
         return len(self.current_files)
 
+    def visible_index_of(self, image_path: str) -> Optional[int]:
+        """Position of image_path in current_files, or None if unknown or filtered out."""
+        # why: both maps are maintained alongside current_files, so this is
+        # O(1) where current_files.index() scans the whole directory.
+        original_idx = self._path_to_idx.get(image_path)
+        if original_idx is None:
+            return None
+        return self._original_to_visible_mapping.get(original_idx)
+
     def filter_affects_rating(self) -> bool:
         return not all(self._current_star_filter)
 
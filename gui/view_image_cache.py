@@ -0,0 +1,52 @@
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+
+class ViewImageCache:
+    """Client-side LRU of encoded view-image bytes, bounded by total size.
+
+    Filled by neighbour prefetches and by PictureView loads of daemon
+    mem-cached images, so opening a warmed image skips both socket
+    round-trips.
+    """
+
+    MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, max_bytes: int = MAX_BYTES):
+        self._max_bytes = max_bytes
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> Optional[bytes]:
+        """Return cached bytes for path, or None if not cached."""
+        with self._lock:
+            data = self._cache.get(path)
+            if data is not None:
+                self._cache.move_to_end(path)
+            return data
+
+    def put(self, path: str, data: bytes) -> None:
+        if len(data) > self._max_bytes:
+            return
+        with self._lock:
+            old = self._cache.pop(path, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._cache[path] = data
+            self._bytes += len(data)
+            while self._bytes > self._max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def invalidate(self, path: str) -> None:
+        with self._lock:
+            old = self._cache.pop(path, None)
+            if old is not None:
+                self._bytes -= len(old)
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._bytes
@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import json
 import typing
 from typing import Any, List, Dict, Optional
@@ -20,13 +21,11 @@ class Message:
         element is a bare ``str``, it is coerced to ``ImageEntryModel(path=str)``.
         This keeps CLI tools and old protocol clients working.
         """
-        hints = typing.get_type_hints(cls)
         kwargs = {}
-        for f in dataclasses.fields(cls):
-            if f.name not in data:
+        for name, hint in _field_hints(cls):
+            if name not in data:
                 continue
-            val = data[f.name]
-            hint = hints.get(f.name)
+            val = data[name]
             origin = getattr(hint, '__origin__', None)
             # List[MessageSubclass]
             if origin is list and val:
@@ -53,7 +52,7 @@ class Message:
             # Bare ImageEntryModel from str
             elif isinstance(hint, type) and hint is ImageEntryModel and isinstance(val, str):
                 val = ImageEntryModel(path=val)
-            kwargs[f.name] = val
+            kwargs[name] = val
         return cls(**kwargs)
 
     def model_dump(self) -> dict:
@@ -63,6 +62,15 @@ class Message:
         return json.dumps(self.model_dump())
 
 
+@functools.cache
+def _field_hints(cls: type) -> tuple:
+    """(field name, resolved type hint) pairs for a Message subclass."""
+    # why: get_type_hints re-evaluates every annotation on each call, which
+    # dominated model_validate for per-file notifications like previews_ready.
+    hints = typing.get_type_hints(cls)
+    return tuple((f.name, hints.get(f.name)) for f in dataclasses.fields(cls))
+
+
 # ==============================================================================
 #  ImageEntryModel — wire representation of ImageEntry
 # ==============================================================================
@@ -5,14 +5,10 @@ import os
 import logging
 from typing import List, Optional, Dict, Any, Union
 from plugins.base_plugin import BasePlugin
+from utils.media_types import VIDEO_EXTENSIONS
 
 logger = logging.getLogger(__name__)
 
-VIDEO_EXTENSIONS = [
-    '.mp4', '.mov', '.mkv', '.avi', '.webm', '.m4v',
-    '.wmv', '.flv', '.mpg', '.mpeg', '.3gp', '.ts',
-]
-
 
 @functools.lru_cache(maxsize=1)
 def _is_ffmpeg_available() -> bool:
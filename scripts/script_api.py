@@ -271,6 +271,7 @@ class ScriptAPI:
                 event_type=EventType.STATUS_MESSAGE, source="script_api",
                 timestamp=time.time(), message=f"Finished rating {num_images} images.", timeout=5000
             ))
+            self.main_window.forget_metadata(image_paths)
             # Update the rating section if the visible image was just rated
             self._update_status_bar_rating_if_visible(image_paths, rating)
             # Only reapply filters when a star or text filter is active — otherwise
@@ -292,6 +293,7 @@ class ScriptAPI:
             return
         response = self.socket_client.set_tags(image_paths, tags)
         if response and response.status == "success":
+            self.main_window.forget_metadata(image_paths)
             logging.debug(f"set_tags_for_images: {len(tags)} tags set on {len(image_paths)} images.")
         else:
             logging.error(f"ScriptAPI: Failed to set tags. Response: {response}")
@@ -302,6 +304,7 @@ class ScriptAPI:
             return
         response = self.socket_client.remove_tags(image_paths, tags)
         if response and response.status == "success":
+            self.main_window.forget_metadata(image_paths)
             logging.debug(f"remove_tags_from_images: {len(tags)} tags removed from {len(image_paths)} images.")
         else:
             logging.error(f"ScriptAPI: Failed to remove tags. Response: {response}")
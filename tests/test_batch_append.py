@@ -399,3 +399,20 @@ class TestThumbPathPickup:
         # Should be removed from initial store
         assert "/img/a.jpg" not in view._initial_thumb_paths
         assert "/img/b.jpg" not in view._initial_thumb_paths
+
+
+# ===================================================================
+# Visible index lookup
+# ===================================================================
+
+class TestVisibleIndexOf:
+
+    def test_maps_through_original_index(self):
+        view = _make_view(all_files=["/img/a.jpg", "/img/b.jpg", "/img/c.jpg"])
+        # Hide b: c moves to visible slot 1.
+        view._hidden_indices = {1}
+        view._original_to_visible_mapping = {0: 0, 2: 1}
+
+        assert ThumbnailViewWidget.visible_index_of(view, "/img/c.jpg") == 1
+        assert ThumbnailViewWidget.visible_index_of(view, "/img/b.jpg") is None
+        assert ThumbnailViewWidget.visible_index_of(view, "/img/zzz.jpg") is None
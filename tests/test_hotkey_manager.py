@@ -0,0 +1,142 @@
+# tests/test_hotkey_manager.py
+"""Tests for HotkeyManager event publishing and range-selection release routing."""
+import sys
+from unittest.mock import MagicMock, patch
+
+from core.event_system import event_system, EventType
+
+
+def _ensure_stubs():
+    """Add the Qt stubs gui.hotkey_manager needs beyond conftest's."""
+    qtgui = sys.modules["PySide6.QtGui"]
+    for name in ("QKeySequence", "QAction", "QActionGroup"):
+        if not hasattr(qtgui, name):
+            setattr(qtgui, name, type(name, (), {"__init__": lambda self, *a, **kw: None}))
+
+    qtcore = sys.modules["PySide6.QtCore"]
+    if not hasattr(qtcore, "QEvent"):
+        qtcore.QEvent = type("QEvent", (), {})
+    if not hasattr(qtcore.Qt, "ApplicationShortcut"):
+        qtcore.Qt.ApplicationShortcut = 0
+
+
+class _FakeApp:
+    def __init__(self):
+        self.filters = []
+
+    def installEventFilter(self, f): self.filters.append(f)
+    def removeEventFilter(self, f): self.filters.remove(f)
+
+
+class _FakeModifiers:
+    value = 0
+
+
+class _FakeKeyEvent:
+    def __init__(self, key, event_type, auto_repeat=False):
+        self._key = key
+        self._type = event_type
+        self._auto_repeat = auto_repeat
+
+    def type(self): return self._type
+    def key(self): return self._key
+    def modifiers(self): return _FakeModifiers()
+    def isAutoRepeat(self): return self._auto_repeat
+
+
+_KEY_S = 0x53
+_KEY_RELEASE = 7
+
+
+def _make_manager(app):
+    _ensure_stubs()
+    from gui.hotkey_manager import HotkeyManager, _route_key
+
+    hm = object.__new__(HotkeyManager)
+    hm._publish = event_system.publish
+    hm._now = __import__("time").time
+    hm._app = app
+    hm._awaiting_release = False
+    hm._shortcuts_suppressed = False
+    hm._KEY_RELEASE = _KEY_RELEASE
+    hm._mod_mask = 0
+    hm._release_routes = {_route_key(_KEY_S, 0): hm.handle_range_selection_end}
+    return hm
+
+
+class _Recorder:
+    def __init__(self, *event_types):
+        self.events = []
+        self._types = event_types
+        for t in event_types:
+            event_system.subscribe(t, self.events.append)
+
+    def close(self):
+        for t in self._types:
+            event_system.unsubscribe(t, self.events.append)
+
+
+# ===========================================================================
+# Range selection across windows
+# ===========================================================================
+
+class TestRangeSelectionRelease:
+    def test_release_in_another_window_ends_range(self):
+        app = _FakeApp()
+        hm = _make_manager(app)
+        rec = _Recorder(EventType.RANGE_SELECTION_START, EventType.RANGE_SELECTION_END)
+        try:
+            # Press fires through the application-wide QAction.
+            hm.handle_range_selection_start()
+            assert app.filters == [hm]
+
+            # The release is delivered to a widget in an inspector window.
+            inspector_window = MagicMock(name="inspector")
+            consumed = hm.eventFilter(inspector_window, _FakeKeyEvent(_KEY_S, _KEY_RELEASE))
+        finally:
+            rec.close()
+
+        assert consumed is True
+        assert [e.event_type for e in rec.events] == [
+            EventType.RANGE_SELECTION_START, EventType.RANGE_SELECTION_END]
+        # The app-wide filter only lives for the duration of the hold.
+        assert app.filters == []
+
+    def test_autorepeat_release_keeps_range_open(self):
+        app = _FakeApp()
+        hm = _make_manager(app)
+        rec = _Recorder(EventType.RANGE_SELECTION_END)
+        try:
+            hm.handle_range_selection_start()
+            hm.eventFilter(MagicMock(), _FakeKeyEvent(_KEY_S, _KEY_RELEASE, auto_repeat=True))
+        finally:
+            rec.close()
+
+        assert rec.events == []
+        assert app.filters == [hm]
+
+
+# ===========================================================================
+# Published events in history
+# ===========================================================================
+
+class TestPublishedEvents:
+    def test_history_entries_keep_distinct_timestamps(self):
+        _ensure_stubs()
+        from gui.hotkey_manager import _make_publisher, _make_zoom_publisher
+
+        event_system.clear_history()
+        # Publishers bind time.time when created, so build them under the patch.
+        with patch("time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            next_image = _make_publisher(EventType.NAVIGATE_NEXT)
+            zoom_in = _make_zoom_publisher(EventType.ZOOM_IN)
+            next_image()
+            next_image()
+            zoom_in()
+            zoom_in()
+
+        nav = event_system.get_event_history(EventType.NAVIGATE_NEXT)
+        zoom = event_system.get_event_history(EventType.ZOOM_IN)
+        assert [e.timestamp for e in nav] == [1.0, 2.0]
+        assert [e.timestamp for e in zoom] == [3.0, 4.0]
+        assert zoom[0].zoom_factor == 1.25
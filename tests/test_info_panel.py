@@ -21,12 +21,22 @@ class TestSection:
     def test_defaults(self):
         s = Section("Title")
         assert s.title == "Title"
-        assert s.rows == []
+        assert s.rows == ()
 
     def test_with_rows(self):
         rows = [("key", "val")]
         s = Section("T", rows)
-        assert s.rows == rows
+        assert s.rows == tuple(rows)
+
+    def test_key_defaults_empty(self):
+        assert Section("T").key == ""
+        assert Section("T", key="t").key == "t"
+
+    def test_frozen_and_hashable(self):
+        s = Section("T", [("a", "b")])
+        with pytest.raises(AttributeError):
+            s.title = "other"
+        assert hash(s) == hash(Section("T", (("a", "b"),)))
 
 
 # ---------------------------------------------------------------------------
@@ -53,6 +63,14 @@ class TestMetadataCache:
         cache.put("/img.jpg", {"rating": 5})
         assert cache.get("/img.jpg")["rating"] == 5
 
+    def test_put_precomputes_display_fields(self):
+        cache = self._make_cache()
+        cache.put("/img.jpg", {"rating": 2, "file_size": 3 * 1024 * 1024, "date_taken": None})
+        meta = cache.get("/img.jpg")
+        assert meta["_formatted_size"] == "3.0 MB"
+        assert meta["_rating_stars"] == "\u2605\u2605"
+        assert meta["_formatted_date"] is None
+
     def test_put_batch(self):
         cache = self._make_cache()
         batch = {
@@ -94,6 +112,34 @@ class TestMetadataCache:
         assert cache.get("/a.jpg") is not None
         assert cache.get("/b.jpg") is None
 
+    def test_version_for_missing_is_zero(self):
+        cache = self._make_cache()
+        assert cache.version_for("/no/such") == 0
+
+    def test_version_bumps_on_write(self):
+        cache = self._make_cache()
+        cache.put("/img.jpg", {"rating": 1})
+        v1 = cache.version_for("/img.jpg")
+        cache.put_batch({"/img.jpg": {"rating": 2}})
+        v2 = cache.version_for("/img.jpg")
+        assert 0 < v1 < v2
+
+    def test_identical_rewrite_keeps_version(self):
+        cache = self._make_cache()
+        cache.put("/img.jpg", {"rating": 1})
+        v1 = cache.version_for("/img.jpg")
+        cache.put_batch({"/img.jpg": {"rating": 1}})
+        assert cache.version_for("/img.jpg") == v1
+
+    def test_version_reset_on_invalidate_and_evict(self):
+        cache = self._make_cache()
+        cache.MAX_ENTRIES = 1
+        cache.put("/a.jpg", {"a": 1})
+        cache.put("/b.jpg", {"b": 2})  # evicts /a.jpg
+        assert cache.version_for("/a.jpg") == 0
+        cache.invalidate("/b.jpg")
+        assert cache.version_for("/b.jpg") == 0
+
     def test_fetch_and_cache_success(self):
         mock_client = MagicMock()
         resp = MagicMock()
@@ -283,6 +329,25 @@ class TestMetadataProvider:
         assert len(exp_sec.rows) == 1
         assert exp_sec.rows[0] == ("Aperture", "f/2.8")
 
+    def test_sections_memoized_until_version_changes(self):
+        real = MetadataCache(MagicMock())
+        real.put("/img.jpg", {"rating": 2})
+        p = MetadataProvider(real)
+        first = p.get_sections("/img.jpg")
+        assert p.get_sections("/img.jpg") is first
+        real.put("/img.jpg", {"rating": 4})
+        second = p.get_sections("/img.jpg")
+        assert second is not first
+        file_sec = [s for s in second if s.title == "File"][0]
+        assert ("Rating", "\u2605" * 4) in file_sec.rows
+
+    def test_sections_have_stable_keys(self):
+        p = self._make_provider({"/img.jpg": {
+            "camera_make": "Canon", "aperture": 2.8,
+        }})
+        keys = [s.key for s in p.get_sections("/img.jpg")]
+        assert keys == ["file", "camera", "exposure"]
+
     def test_full_metadata(self):
         """All fields populated — should produce all 3 sections."""
         meta = {
@@ -325,8 +390,8 @@ class TestScriptOutputProvider:
         p = ScriptOutputProvider()
         p.receive_output("/a.jpg", "k", "v1")
         p.receive_output("/b.jpg", "k", "v2")
-        assert p.get_sections("/a.jpg")[0].rows == [("k", "v1")]
-        assert p.get_sections("/b.jpg")[0].rows == [("k", "v2")]
+        assert p.get_sections("/a.jpg")[0].rows == (("k", "v1"),)
+        assert p.get_sections("/b.jpg")[0].rows == (("k", "v2"),)
 
 
 # ---------------------------------------------------------------------------
@@ -348,5 +413,5 @@ class TestContentProviderABC:
 
         d = Dummy()
         assert d.provider_name == "Dummy"
-        assert d.get_sections("/x")[0].rows == [("a", "b")]
+        assert d.get_sections("/x")[0].rows == (("a", "b"),)
         d.on_cleanup()  # should not raise
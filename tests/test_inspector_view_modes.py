@@ -34,6 +34,27 @@ def _ensure_qt_stubs():
     if not hasattr(qtcore, "Slot"):
         qtcore.Slot = lambda *a, **kw: (lambda fn: fn)
 
+    if not hasattr(qtcore, "QTimer"):
+        class _QTimer:
+            def __init__(self, *a): pass
+            def setSingleShot(self, v): pass
+            def setInterval(self, v): pass
+            def start(self, *a): pass
+            def stop(self): pass
+            def isActive(self): return False
+            @staticmethod
+            def singleShot(ms, fn): pass
+            @property
+            def timeout(self): return MagicMock()
+        qtcore.QTimer = _QTimer
+
+    if not hasattr(qtcore, "QThreadPool"):
+        class _QThreadPool:
+            @staticmethod
+            def globalInstance(): return _QThreadPool()
+            def start(self, fn): fn()
+        qtcore.QThreadPool = _QThreadPool
+
     if not hasattr(qtcore, "QSettings"):
         class _QSettings:
             def __init__(self, *a): pass
@@ -50,6 +71,9 @@ def _ensure_qt_stubs():
             def height(self): return self._h
         qtcore.QSizeF = _QSizeF
 
+    if not hasattr(qtcore, "QSize"):
+        qtcore.QSize = qtcore.QSizeF
+
     if not hasattr(qtcore, "QRectF"):
         class _QRectF:
             def __init__(self, *a): pass
@@ -58,6 +82,9 @@ def _ensure_qt_stubs():
             def top(self): return 0
         qtcore.QRectF = _QRectF
 
+    if not hasattr(qtcore, "QRect"):
+        qtcore.QRect = qtcore.QRectF
+
     # QtGui
     qtgui = sys.modules.get("PySide6.QtGui")
     if qtgui is None:
@@ -73,6 +100,12 @@ def _ensure_qt_stubs():
             def copy(self): return self
         qtgui.QImage = _QImage
 
+    if not hasattr(qtgui, "QImageReader"):
+        qtgui.QImageReader = type("QImageReader", (), {"__init__": lambda self, *a: None})
+
+    if not hasattr(qtgui, "QRegion"):
+        qtgui.QRegion = type("QRegion", (), {"__init__": lambda self, *a: None})
+
     if not hasattr(qtgui, "QPainter"):
         class _QPainter:
             SmoothPixmapTransform = 0
@@ -98,6 +131,7 @@ def _ensure_qt_stubs():
             def __init__(self, *a, **kw): pass
             def setWindowTitle(self, t): pass
             def setMinimumSize(self, w, h): pass
+            def setAttribute(self, a, on=True): pass
             def resize(self, w, h): pass
             def restoreGeometry(self, g): pass
             def saveGeometry(self): return b""
@@ -125,6 +159,12 @@ def _ensure_qt_stubs():
         qt.ArrowCursor = 0
         qt.black = 0
 
+    if not hasattr(qt, "DirectConnection"):
+        qt.DirectConnection = 1
+
+    if not hasattr(qt, "WA_OpaquePaintEvent"):
+        qt.WA_OpaquePaintEvent = 0
+
     if not hasattr(qt, "CursorShape"):
         class _CursorShape:
             ClosedHandCursor = 1
@@ -194,6 +234,7 @@ def inspector():
     mock_transform = MagicMock()
     mock_transform.inverted.return_value = (MagicMock(), True)
     iv._picture_base.calculateTransform.return_value = mock_transform
+    iv._picture_base.cachedInverseTransform.return_value = (MagicMock(), True)
     iv._current_image_path = "/fake/image.jpg"
     iv._view_image_ready = True
 
@@ -232,6 +273,20 @@ class TestWheelZoomDoesNotLock:
 
         assert iv._view_mode == Mode.MANUAL
 
+    def test_ticks_coalesce_into_one_zoom(self, inspector):
+        iv, Mode = inspector
+        iv._view_mode = Mode.TRACKING
+        iv.set_zoom_factor = MagicMock()
+        iv._zoom_factor = 2.0
+
+        for delta in (120, 120, 120, -120):
+            iv.wheelEvent(FakeWheelEvent(delta_y=delta))
+        iv.set_zoom_factor.assert_not_called()
+        iv._apply_wheel_zoom()
+
+        iv.set_zoom_factor.assert_called_once_with(2.0 * 1.25 ** 2)
+        assert iv._wheel_acc == 0
+
 
 class TestDoubleClickCycles:
     """Double-click must toggle between tracking and fit."""
@@ -257,6 +312,18 @@ class TestDoubleClickCycles:
         iv._picture_base.setFitMode.assert_called_with(False)
         iv._picture_base.setZoom.assert_called()
 
+    def test_fit_to_tracking_reloads_full_resolution(self, inspector):
+        """An image decoded at viewport size for FIT is reloaded before zooming in."""
+        iv, Mode = inspector
+        iv._view_mode = Mode.FIT
+        iv._fit_decoded_from = "/cache/view.jpg"
+        Qt = sys.modules["PySide6.QtCore"].Qt
+
+        iv.mouseDoubleClickEvent(FakeMouseEvent(button=Qt.LeftButton))
+
+        iv._picture_base.loadImageFromPath.assert_called_once_with("/cache/view.jpg")
+        assert iv._fit_decoded_from is None
+
     def test_manual_to_fit(self, inspector):
         """From locked/manual, double-click goes to fit."""
         iv, Mode = inspector
@@ -327,6 +394,24 @@ class TestPanningEntersManual:
 
         assert iv._view_mode == Mode.MANUAL
 
+    def test_moves_coalesce_into_one_center_change(self, inspector):
+        iv, Mode = inspector
+        Qt = sys.modules["PySide6.QtCore"].Qt
+        iv._view_mode = Mode.TRACKING
+        pb = iv._picture_base
+        pb.viewState.return_value.center = FakeMouseEvent(x=0.5, y=0.5)
+
+        iv.mousePressEvent(FakeMouseEvent(button=Qt.LeftButton, x=100, y=100))
+        pan = iv._pan
+        pan.m11, pan.m12, pan.m21, pan.m22 = 1.0, 0.0, 0.0, 1.0
+        pan.padded_w = pan.padded_h = 100.0
+        iv.mouseMoveEvent(FakeMouseEvent(button=Qt.LeftButton, x=110, y=100))
+        iv.mouseMoveEvent(FakeMouseEvent(button=Qt.LeftButton, x=120, y=100))
+        pb.setCenterXY.assert_not_called()
+        iv._flush_pan()
+
+        pb.setCenterXY.assert_called_once_with(pytest.approx(0.3), pytest.approx(0.5))
+
 
 class TestRightDragZoomDoesNotLock:
     """Right-click drag zoom must not enter manual/locked mode."""
@@ -342,3 +427,251 @@ class TestRightDragZoomDoesNotLock:
         iv.mouseMoveEvent(FakeMouseEvent(button=Qt.RightButton, x=130, y=100))
 
         assert iv._view_mode == Mode.TRACKING
+
+
+class TestStatusBatcher:
+    """Concurrent inspector lookups for one path share a single request."""
+
+    def test_same_path_is_queued_once_and_fans_out(self):
+        from gui.inspector_view import _StatusBatcher
+
+        batcher = _StatusBatcher()
+        client = MagicMock()
+        got = []
+        batcher.request(client, "/a.jpg", lambda p, v: got.append(("first", p, v)))
+        batcher.request(client, "/a.jpg", lambda p, v: got.append(("second", p, v)))
+        batcher.request(client, "/b.jpg", lambda p, v: got.append(("third", p, v)))
+
+        assert list(batcher._pending[client]) == ["/a.jpg", "/b.jpg"]
+
+        batcher._dispatch({"/a.jpg": "/cache/a.jpg"})
+
+        assert got == [("first", "/a.jpg", "/cache/a.jpg"),
+                       ("second", "/a.jpg", "/cache/a.jpg")]
+        assert "/b.jpg" in batcher._waiters
+
+    def test_ready_status_is_answered_from_cache(self):
+        from gui.inspector_view import _StatusBatcher
+        batcher = _StatusBatcher()
+        client = MagicMock()
+        got = []
+        batcher.request(client, "/a.jpg", lambda p, v: None)
+        batcher._pending.clear()
+        batcher._dispatch({"/a.jpg": "/cache/a.jpg"})
+
+        batcher.request(client, "/a.jpg", lambda p, v: got.append(v))
+
+        assert got == ["/cache/a.jpg"]
+        assert not batcher._pending
+
+        batcher.invalidate("/a.jpg")
+        batcher.request(client, "/a.jpg", lambda p, v: got.append(v))
+
+        assert list(batcher._pending[client]) == ["/a.jpg"]
+
+    def test_flushes_share_one_worker_thread(self):
+        from gui.inspector_view import _StatusBatcher
+        batcher = _StatusBatcher()
+        client = MagicMock()
+
+        with patch("gui.inspector_view.threading.Thread") as thread:
+            batcher.request(client, "/a.jpg", lambda p, v: None)
+            batcher._flush()
+            batcher.request(client, "/b.jpg", lambda p, v: None)
+            batcher._flush()
+
+        thread.assert_called_once()
+        assert batcher._batches.get_nowait() == (client, ["/a.jpg"])
+        assert batcher._batches.get_nowait() == (client, ["/b.jpg"])
+
+    def test_raising_callback_does_not_strand_other_paths(self):
+        from gui.inspector_view import _StatusBatcher
+        batcher = _StatusBatcher()
+        client = MagicMock()
+        got = []
+
+        def closed_inspector(p, v):
+            raise RuntimeError("Internal C++ object already deleted")
+
+        batcher.request(client, "/a.jpg", closed_inspector)
+        batcher.request(client, "/b.jpg", lambda p, v: got.append(p))
+        batcher._dispatch({"/a.jpg": "/cache/a.jpg", "/b.jpg": "/cache/b.jpg"})
+
+        assert got == ["/b.jpg"]
+        assert not batcher._waiters
+
+
+class TestPrefetchNeighbors:
+    """Neighbor prefetch skips paths it already requested and videos."""
+
+    def test_repeat_paths_are_not_requested_again(self, inspector):
+        iv, _ = inspector
+        iv.socket_client = MagicMock()
+
+        pool = MagicMock()
+        iv.prefetch_neighbors(["/a.jpg", "/clip.mp4", "/b.jpg"], pool)
+        iv.prefetch_neighbors(["/b.jpg", "/a.jpg"], pool)
+
+        pool.submit.assert_called_once()
+        assert pool.submit.call_args.args[2] == ["/a.jpg", "/b.jpg"]
+
+
+class TestUpdateCoalescing:
+    """Bursts of inspector updates are applied once, with the newest event."""
+
+    def test_only_latest_update_is_applied(self, inspector):
+        iv, Mode = inspector
+        iv._view_mode = Mode.TRACKING
+        iv._pinned = True
+        iv._current_image_path = "/pinned.jpg"
+        iv._schedule_center = MagicMock()
+        iv.isVisible = lambda: True
+
+        for x in (0.1, 0.2, 0.3):
+            iv._handle_inspector_update(MagicMock(
+                image_path="/other.jpg", normalized_position=FakeMouseEvent(x=x, y=0.5)))
+        iv._schedule_center.assert_not_called()
+        iv._flush_inspector_update()
+
+        iv._schedule_center.assert_called_once()
+        assert iv._schedule_center.call_args.args[0].x() == 0.3
+
+
+class TestVideoScrub:
+    """Scrub request filtering and frame hand-off."""
+
+    def test_sub_frame_moves_are_dropped_unless_forced(self, inspector):
+        iv, _ = inspector
+        iv._ensure_scrub_worker = MagicMock()
+        iv._scrub_frame_step = ("/clip.mp4", 0.01)
+        iv.width = iv.height = lambda: 300
+        iv.devicePixelRatioF = lambda: 2.0
+
+        iv._request_video_frame("/clip.mp4", 0.5)
+        iv._request_video_frame("/clip.mp4", 0.505)
+        assert iv._scrub_slot[-1][2] == 0.5
+
+        iv._request_video_frame("/clip.mp4", 0.52)
+        assert iv._scrub_slot[-1][2] == 0.52
+
+        iv._request_video_frame("/clip.mp4", 0.521, force=True)
+        assert iv._scrub_slot[-1][2] == 0.521
+        # mpv scales frames to the window's device-pixel box.
+        assert iv._scrub_slot[-1][3:] == (600, 600)
+
+    def test_same_size_frame_skips_refit(self, inspector):
+        iv, _ = inspector
+        iv._is_video_mode = True
+        pb = iv._picture_base
+        pb.isFitMode.return_value = True
+        pb.imageRect.return_value = MagicMock(**{"width.return_value": 640,
+                                                 "height.return_value": 360})
+        frame = MagicMock(**{"isNull.return_value": False,
+                             "width.return_value": 640, "height.return_value": 360})
+
+        iv._on_video_frame_ready((frame, b""))
+        pb.setFitMode.assert_not_called()
+
+        frame.width.return_value = 320
+        iv._on_video_frame_ready((frame, b""))
+        pb.setFitMode.assert_called_once_with(True)
+
+    def test_hide_release_stops_worker_without_reviving_it(self, inspector):
+        iv, _ = inspector
+        started = []
+
+        class _Thread:
+            def __init__(self, target, args, **kw):
+                self.stop = args[0]
+                self.joined = False
+                started.append(self)
+            def start(self): pass
+            def is_alive(self): return True
+            def join(self, timeout=None): self.joined = True
+
+        with patch("gui.inspector_view.threading.Thread", _Thread):
+            iv._ensure_scrub_worker()
+            first = started[0]
+            # Hide path: signal the worker but never block the GUI thread.
+            iv._destroy_scrub_player()
+            assert first.stop.is_set() and not first.joined
+
+            # Re-show while the old worker is still tearing down mpv.
+            iv._ensure_scrub_worker()
+            second = started[1]
+            assert first.stop.is_set()
+            assert not second.stop.is_set()
+
+            iv._destroy_scrub_player(wait=True)
+            assert second.joined
+
+
+class TestFitDecode:
+    """FIT decodes at device-pixel size and re-decodes only after a resize settles."""
+
+    def test_decode_is_capped_at_device_pixels(self, inspector):
+        iv, Mode = inspector
+        iv._view_mode = Mode.FIT
+        iv.width = iv.height = lambda: 300
+        iv.devicePixelRatioF = lambda: 2.0
+        pb = iv._picture_base
+        pb.loadImageFromPath.return_value = True
+        pb.isDecodeScaled.return_value = True
+
+        iv._load_view_file("/cache/view.jpg")
+
+        cap = pb.loadImageFromPath.call_args.args[1]
+        assert (cap.width(), cap.height()) == (600, 600)
+        assert iv._fit_decoded_from == "/cache/view.jpg"
+
+        # Native size already fits: nothing more to decode on resize or zoom-in.
+        pb.isDecodeScaled.return_value = False
+        iv._load_view_file("/cache/small.jpg")
+        assert iv._fit_decoded_from is None
+
+    def test_resize_defers_redecode_until_outgrown(self, inspector):
+        iv, Mode = inspector
+        iv._view_mode = Mode.FIT
+        iv.width = iv.height = lambda: 300
+        iv.devicePixelRatioF = lambda: 1.0
+        iv._fit_decoded_from = "/cache/view.jpg"
+        iv._fit_decode_timer = MagicMock()
+        pb = iv._picture_base
+        pb.loadImageFromPath.return_value = True
+        pb.isDecodeScaled.return_value = True
+
+        iv.resizeEvent(MagicMock())
+        iv._fit_decode_timer.start.assert_called_once()
+        pb.loadImageFromPath.assert_not_called()
+
+        # Decode still covers the 300x300 window in one dimension.
+        pb.get_image.return_value = MagicMock(**{"width.return_value": 300,
+                                                 "height.return_value": 200})
+        iv._redecode_for_fit()
+        pb.loadImageFromPath.assert_not_called()
+
+        pb.get_image.return_value = MagicMock(**{"width.return_value": 200,
+                                                 "height.return_value": 150})
+        iv._redecode_for_fit()
+        pb.loadImageFromPath.assert_called_once()
+
+
+class TestScaledPixmapCache:
+    """Minified pre-scaled copies are bounded by bytes."""
+
+    def test_oldest_copies_are_evicted_over_budget(self, inspector):
+        iv, _ = inspector
+        pb = iv._picture_base
+        pb.get_image.return_value.cacheKey.return_value = 1
+        source = pb.get_pixmap.return_value
+        source.width.return_value = source.height.return_value = 200
+        source.scaled.side_effect = lambda *a: MagicMock(**{
+            "width.return_value": 100, "height.return_value": 100, "depth.return_value": 32})
+        iv._SCALED_CACHE_MAX_BYTES = 2 * 100 * 100 * 4
+
+        with patch("gui.inspector_view.Qt"):
+            for zoom in (0.5, 0.6, 0.7):
+                iv._scaled_pixmap(zoom)
+
+        assert list(iv._scaled_cache) == [0.6, 0.7]
+        assert iv._scaled_cache_bytes == 2 * 100 * 100 * 4
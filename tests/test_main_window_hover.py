@@ -0,0 +1,429 @@
+# tests/test_main_window_hover.py
+"""
+Unit tests for MainWindow's settled-hover pipeline.
+
+Covers the hover-settle guard, the shared hover pool and the view-image
+prefetch dedupe, using a MainWindow built without running __init__.
+"""
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+_QT_MODULES = ("PySide6.QtWidgets", "PySide6.QtCore", "PySide6.QtGui")
+
+
+@pytest.fixture(scope="module")
+def main_window_module():
+    """Import gui.main_window with permissive stubs for Qt names conftest lacks.
+
+    Modules first imported here are dropped again afterwards so later test
+    files import them against their own stubs.
+    """
+    before = set(sys.modules)
+    qt = [sys.modules[name] for name in _QT_MODULES]
+    def stub(name):
+        if name == "Slot":
+            # Keep decorated slots callable as plain methods.
+            return lambda *types: (lambda fn: fn)
+        return type(name, (MagicMock,), {})
+
+    for module in qt:
+        module.__getattr__ = stub
+    try:
+        import gui.main_window as mw
+    finally:
+        for module in qt:
+            del module.__getattr__
+    yield mw
+    for name in set(sys.modules) - before:
+        del sys.modules[name]
+
+
+@pytest.fixture
+def window(main_window_module):
+    mw = object.__new__(main_window_module.MainWindow)
+    mw.thumbnail_view = MagicMock()
+    mw.thumbnail_view.visible_index_of.return_value = None
+    mw.metadata_cache = MagicMock()
+    mw.metadata_cache.get.return_value = None
+    mw.stacked_widget = MagicMock()
+    mw.stacked_widget.currentWidget.return_value = mw.thumbnail_view
+    mw.picture_view = MagicMock()
+    mw.video_view = MagicMock()
+    mw._active_view = main_window_module._ActiveView.THUMBNAILS
+    mw.status_bar = None
+    mw.info_panels = main_window_module.OrderedDict()
+    mw.inspector_views = main_window_module.OrderedDict()
+    mw.socket_client = MagicMock()
+    mw._hover_pool = MagicMock()
+    mw._inflight_hover_future = None
+    mw._inflight_hover_path = None
+    mw._hover_prefetch_path = None
+    mw._hover_timer = MagicMock()
+    mw._hover_settle_ms = 150
+    mw._hover_mode = main_window_module._HoverTimerMode.IDLE
+    mw._recent_prefetch = main_window_module.OrderedDict()
+    mw._recent_rating_fetch = main_window_module.OrderedDict()
+    mw._last_nav_dir = 1
+    return mw
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestSettledHover:
+    """Status, info panels and prefetch only run for the hover that settled."""
+
+    def test_superseded_hover_is_ignored(self, window):
+        panel = MagicMock()
+        window.info_panels = {id(panel): panel}
+        window._hover_prefetch_path = "/a.jpg"
+        window.thumbnail_view.get_hovered_image_path.return_value = "/b.jpg"
+
+        window._do_hover_prefetch()
+
+        panel.on_thumbnail_hovered.assert_not_called()
+        window._hover_pool.submit.assert_not_called()
+
+    def test_settled_hover_reaches_info_panels(self, window):
+        panel = MagicMock()
+        window.info_panels = {id(panel): panel}
+        window._hover_prefetch_path = "/a.jpg"
+        window.thumbnail_view.get_hovered_image_path.return_value = "/a.jpg"
+
+        window._do_hover_prefetch()
+
+        panel.on_thumbnail_hovered.assert_called_once_with("/a.jpg")
+
+    def test_settled_hover_sets_status_bar_directly(self, window):
+        window.status_bar = MagicMock()
+        window._last_rating_set_time = 0.0
+        window._hover_prefetch_path = "/a.jpg"
+        window.thumbnail_view.get_hovered_image_path.return_value = "/a.jpg"
+
+        window._do_hover_prefetch()
+        window._on_hover_rating_ready("/a.jpg", 3)
+        window._on_hover_rating_ready("/old.jpg", 5)
+
+        window.status_bar.setFilepath.assert_called_once_with("/a.jpg")
+        window.status_bar.setRating.assert_called_once_with(3)
+
+
+class TestHoverTimer:
+    """One timer carries either the settle or the deferred clear."""
+
+    def test_hover_after_leave_replaces_pending_clear(self, window, main_window_module):
+        window.thumbnail_view.get_hovered_image_path.return_value = None
+        window._on_thumbnail_left()
+        assert window._hover_mode is main_window_module._HoverTimerMode.CLEAR
+
+        window._on_thumbnail_hovered("/a.jpg")
+        assert window._hover_mode is main_window_module._HoverTimerMode.PREFETCH
+        window._hover_timer.start.assert_called_with(150)
+
+        window._do_hover_prefetch = MagicMock()
+        window._do_hover_clear = MagicMock()
+        window._on_hover_timer()
+        window._do_hover_prefetch.assert_called_once_with()
+        window._do_hover_clear.assert_not_called()
+        assert window._hover_mode is main_window_module._HoverTimerMode.IDLE
+
+
+class TestDetailActive:
+    """The active-view state follows the stacked widget's current page."""
+
+    def test_flag_tracks_current_page(self, window, main_window_module):
+        window.stacked_widget.currentWidget.return_value = window.video_view
+        window._on_stack_changed(1)
+        assert window._active_view is main_window_module._ActiveView.VIDEO
+        assert window._is_detail_view_active()
+
+        window.stacked_widget.currentWidget.return_value = window.thumbnail_view
+        window._on_stack_changed(0)
+        assert not window._is_detail_view_active()
+
+    def test_hover_is_ignored_while_detail_view_is_shown(self, window, main_window_module):
+        window._active_view = main_window_module._ActiveView.PICTURE
+        window._on_thumbnail_hovered("/a.jpg")
+        window._hover_timer.start.assert_not_called()
+
+
+class TestSatelliteWindows:
+    """Inspector and info panel registries drop closed windows by identity."""
+
+    def test_closing_middle_panel_keeps_open_order(self, window):
+        panels = [MagicMock(name=f"panel{i}") for i in range(3)]
+        window.info_panels.update((id(p), p) for p in panels)
+        window._info_panel_slot = 3
+
+        window._on_info_panel_closed(panels[1])
+        assert list(window.info_panels.values()) == [panels[0], panels[2]]
+
+        window._handle_close_or_quit()
+        panels[2].close.assert_called_once_with()
+
+    def test_teardown_close_after_clear_is_ignored(self, window):
+        inspector = MagicMock()
+        window.inspector_views[id(inspector)] = inspector
+        window._inspector_slot = 1
+
+        window._on_inspector_closed(inspector)
+        assert window._inspector_slot == 0
+        window._inspector_slot = 5
+        window._on_inspector_closed(inspector)
+        assert window._inspector_slot == 5
+
+
+class TestHoverPool:
+    """Settled hovers share the pool and drop superseded rating fetches."""
+
+    def test_newer_hover_cancels_queued_rating_fetch(self, window):
+        window.thumbnail_view.get_hovered_image_path.return_value = "/a.jpg"
+        window._hover_prefetch_path = "/a.jpg"
+        window._do_hover_prefetch()
+        first = window._inflight_hover_future
+
+        window.thumbnail_view.get_hovered_image_path.return_value = "/b.jpg"
+        window._hover_prefetch_path = "/b.jpg"
+        window._do_hover_prefetch()
+
+        first.cancel.assert_called_once()
+        assert window._hover_pool.submit.call_args_list == [
+            ((window._fetch_hover_rating, "/a.jpg", [], True),),
+            ((window._fetch_hover_rating, "/b.jpg", [], True),)]
+        # The cancelled task never warmed /a.jpg, so it may be sent again.
+        assert list(window._recent_prefetch) == ["/b.jpg"]
+
+    def test_rating_and_view_image_share_one_task(self, window):
+        calls = []
+        window.metadata_cache.fetch_and_cache.side_effect = (
+            lambda paths: calls.append(("metadata", paths)) or {})
+        window.socket_client.request_view_image.side_effect = (
+            lambda path: calls.append(("view", path)))
+        window._hover_rating_ready = MagicMock()
+        window._hover_metadata_ready = MagicMock()
+
+        window._fetch_hover_rating("/a.jpg", [], True)
+
+        # The rating goes first; the view-image warm-up follows on the same worker.
+        assert calls == [("metadata", ["/a.jpg"]), ("view", "/a.jpg")]
+
+    def test_uncached_neighbors_share_the_rating_round_trip(self, window):
+        window.thumbnail_view.current_files = ["/a.jpg", "/b.jpg", "/c.jpg", "/d.jpg"]
+        window.thumbnail_view.visible_index_of.return_value = 1
+        window.metadata_cache.get.side_effect = lambda p: {} if p == "/c.jpg" else None
+        window.metadata_cache.fetch_and_cache.return_value = {"/b.jpg": {"rating": 4}}
+
+        neighbors = window._uncached_hover_neighbors("/b.jpg")
+        assert neighbors == ["/a.jpg", "/d.jpg"]
+
+        window._hover_rating_ready = MagicMock()
+        window._hover_metadata_ready = MagicMock()
+        window._fetch_hover_rating("/b.jpg", neighbors)
+
+        window.metadata_cache.fetch_and_cache.assert_called_once_with(
+            ["/b.jpg", "/a.jpg", "/d.jpg"])
+        window._hover_rating_ready.emit.assert_called_once_with("/b.jpg", 4)
+        # No info panel is open, so no refresh is queued.
+        window._hover_metadata_ready.emit.assert_not_called()
+
+    def test_metadata_refresh_is_queued_for_open_panels(self, window):
+        panel = MagicMock()
+        window.info_panels[id(panel)] = panel
+        window.metadata_cache.fetch_and_cache.return_value = {}
+        window._hover_rating_ready = MagicMock()
+        window._hover_metadata_ready = MagicMock()
+
+        window._fetch_hover_rating("/a.jpg", [])
+
+        window._hover_metadata_ready.emit.assert_called_once_with("/a.jpg")
+
+    def test_inspector_neighbors_go_through_the_pool(self, window):
+        inspector = MagicMock()
+        window.inspector_views = {id(inspector): inspector}
+        window.thumbnail_view.current_files = ["/a.jpg", "/b.jpg", "/c.jpg"]
+        window.thumbnail_view.visible_index_of.return_value = 1
+
+        window._prefetch_inspector_neighbors("/b.jpg")
+
+        inspector.prefetch_neighbors.assert_called_once_with(
+            ["/a.jpg", "/c.jpg"], window._hover_pool)
+
+
+class TestRatingFetchDedupe:
+    """A re-hover within the TTL serves the rating from the metadata cache."""
+
+    def _rating_fetches(self, window):
+        return [c.args[1] for c in window._hover_pool.submit.call_args_list
+                if c.args[0] == window._fetch_hover_rating]
+
+    def _hover(self, window, path):
+        window._hover_prefetch_path = path
+        window.thumbnail_view.get_hovered_image_path.return_value = path
+        window._do_hover_prefetch()
+
+    def test_rehover_within_ttl_uses_cache(self, window):
+        window.status_bar = MagicMock()
+        window._last_rating_set_time = 0.0
+        self._hover(window, "/a.jpg")
+        window.metadata_cache.get.return_value = {"rating": 2}
+        self._hover(window, "/a.jpg")
+
+        assert self._rating_fetches(window) == ["/a.jpg"]
+        window.status_bar.setRating.assert_called_once_with(2)
+
+    def test_forgotten_metadata_is_fetched_again(self, window):
+        cache = {}
+        window.metadata_cache.get.side_effect = cache.get
+        window.metadata_cache.invalidate.side_effect = lambda p: cache.pop(p, None)
+        self._hover(window, "/a.jpg")
+        cache["/a.jpg"] = {"rating": 2}
+
+        window.forget_metadata(["/a.jpg"])
+        self._hover(window, "/a.jpg")
+
+        assert self._rating_fetches(window) == ["/a.jpg", "/a.jpg"]
+
+
+class TestPrefetchDedupe:
+    """View-image prefetches are sent once per path within the TTL."""
+
+    def _sent(self, window):
+        return [c.args[1] for c in window._hover_pool.submit.call_args_list]
+
+    def test_repeat_within_ttl_is_dropped(self, window, main_window_module):
+        with patch.object(main_window_module.time, "monotonic", side_effect=[100.0, 110.0, 131.0]):
+            window._prefetch_view_image_async("/a.jpg")
+            window._prefetch_view_image_async("/a.jpg")
+            window._prefetch_view_image_async("/a.jpg")
+
+        # The third call is past the 30 s TTL and goes out again.
+        assert self._sent(window) == ["/a.jpg", "/a.jpg"]
+
+    def test_oldest_entry_is_evicted_at_capacity(self, window):
+        window._PREFETCH_MAX = 2
+        for path in ("/a.jpg", "/b.jpg", "/c.jpg"):
+            window._prefetch_view_image_async(path)
+
+        assert list(window._recent_prefetch) == ["/b.jpg", "/c.jpg"]
+        # Evicted paths are no longer deduped.
+        window._prefetch_view_image_async("/a.jpg")
+        assert self._sent(window) == ["/a.jpg", "/b.jpg", "/c.jpg", "/a.jpg"]
+
+
+class TestNeighborPrefetch:
+    """Opening an image warms stills ahead in the browsing direction and one behind."""
+
+    def _sent(self, window):
+        return [c.args[1] for c in window._hover_pool.submit.call_args_list]
+
+    def test_steps_past_adjacent_video(self, window):
+        window.thumbnail_view.current_files = ["/a.jpg", "/b.mp4", "/c.jpg", "/d.jpg"]
+        window.thumbnail_view.visible_index_of.return_value = 2
+
+        window._prefetch_neighbors("/c.jpg")
+
+        # Ahead wraps to /a.jpg; behind steps past the video to /a.jpg too.
+        assert self._sent(window) == ["/d.jpg", "/a.jpg"]
+
+    def test_follows_the_last_navigation_direction(self, window):
+        window.thumbnail_view.current_files = [f"/{i}.jpg" for i in range(10)]
+        window.thumbnail_view.visible_index_of.return_value = 5
+        window._last_nav_dir = -1
+
+        window._prefetch_neighbors("/5.jpg")
+
+        assert self._sent(window) == ["/4.jpg", "/6.jpg", "/3.jpg", "/2.jpg"]
+
+    def test_two_files_prefetch_the_other_once(self, window):
+        window.thumbnail_view.current_files = ["/a.jpg", "/b.jpg"]
+        window.thumbnail_view.visible_index_of.return_value = 0
+
+        window._prefetch_neighbors("/a.jpg")
+
+        # Both directions land on /b.jpg; the TTL dedupe sends it once.
+        assert self._sent(window) == ["/b.jpg"]
+
+
+class TestNavigation:
+    """Arrow-key navigation steps through the visible files with wrap-around."""
+
+    def test_next_wraps_using_the_visible_index(self, window, main_window_module):
+        window._active_view = main_window_module._ActiveView.PICTURE
+        window.picture_view.current_path = "/c.jpg"
+        window.thumbnail_view.current_files = ["/a.jpg", "/b.jpg", "/c.jpg"]
+        window.thumbnail_view.visible_index_of.return_value = 2
+        window._open_media_view = MagicMock()
+
+        window.navigate_to_image("next")
+
+        window.thumbnail_view.visible_index_of.assert_called_once_with("/c.jpg")
+        window._open_media_view.assert_called_once_with("/a.jpg")
+
+    def test_previous_from_video_view(self, window, main_window_module):
+        window._active_view = main_window_module._ActiveView.VIDEO
+        window.video_view.current_path = "/b.mp4"
+        window.thumbnail_view.current_files = ["/a.jpg", "/b.mp4"]
+        window.thumbnail_view.visible_index_of.return_value = 1
+        window._open_media_view = MagicMock()
+
+        window.navigate_to_image("previous")
+
+        window._open_media_view.assert_called_once_with("/a.jpg")
+        assert window._last_nav_dir == -1
+
+    def test_filtered_out_current_media_does_not_move(self, window, main_window_module):
+        window._active_view = main_window_module._ActiveView.PICTURE
+        window.picture_view.current_path = "/hidden.jpg"
+        window.thumbnail_view.current_files = ["/a.jpg"]
+        window._open_media_view = MagicMock()
+
+        window.navigate_to_image("previous")
+
+        window._open_media_view.assert_not_called()
+
+
+class TestWarmViewImage:
+    """Neighbour prefetches keep the bytes of daemon mem-cached view images."""
+
+    def test_memory_view_image_bytes_are_cached(self, window, main_window_module):
+        window.view_image_cache = main_window_module.ViewImageCache()
+        window.socket_client.request_view_image.return_value = MagicMock(
+            status="success", view_image_source="memory")
+        window.socket_client.get_cached_view_image.return_value = b"jpeg"
+
+        window._warm_view_image("/a.jpg")
+
+        assert window.view_image_cache.get("/a.jpg") == b"jpeg"
+
+    def test_disk_view_image_is_not_fetched(self, window, main_window_module):
+        window.view_image_cache = main_window_module.ViewImageCache()
+        window.socket_client.request_view_image.return_value = MagicMock(
+            status="success", view_image_source=None, view_image_path="/cache/a.jpg")
+
+        window._warm_view_image("/a.jpg")
+
+        window.socket_client.get_cached_view_image.assert_not_called()
+        assert window.view_image_cache.get("/a.jpg") is None
+
+
+class TestFiltersApplied:
+    """A detail view leaves media that the new filter hides."""
+
+    def test_filtered_out_media_moves_to_first_visible(self, window):
+        window.stacked_widget.currentWidget.return_value = window.picture_view
+        window._on_stack_changed(1)
+        window.picture_view.current_path = "/hidden.jpg"
+        window.thumbnail_view.current_files = ["/a.jpg", "/b.jpg"]
+        window._open_media_view = MagicMock()
+
+        window._on_filters_applied()
+        window._open_media_view.assert_called_once_with("/a.jpg")
+
+        window._open_media_view.reset_mock()
+        window.thumbnail_view.visible_index_of.return_value = 1
+        window._on_filters_applied()
+        window._open_media_view.assert_not_called()
@@ -604,7 +604,8 @@ class TestMenuRegistry:
 def _ensure_hotkey_stubs():
     """Add stubs needed to import gui.hotkey_manager."""
     qtgui = sys.modules.get("PySide6.QtGui")
-    for name in ("QKeySequence", "QShortcut", "QKeyEvent", "QKeyCombination"):
+    for name in ("QKeySequence", "QShortcut", "QKeyEvent", "QKeyCombination",
+                 "QAction", "QActionGroup"):
         if not hasattr(qtgui, name):
             setattr(qtgui, name, type(name, (), {"__init__": lambda self, *a, **kw: None}))
 
@@ -635,6 +636,8 @@ class TestHotkeyManagerMenuIntegration:
         hm.shortcuts = {}
         hm.definitions = {}
         hm.actions = {}
+        hm._action_group = MagicMock()
+        hm._release_routes = {}
         hm.parent_widget = parent
 
         hm.load_config({
@@ -332,3 +332,49 @@ class TestPluginPerformance:
 
         print(f"\n  pil process_view_image (cache hit): {stats['mean_ms']:.4f} ms mean")
         assert stats["mean_ms"] < 5
+
+
+class TestMediaTypePerformance:
+    """Benchmarks for the per-hover file-type check."""
+
+    def test_is_video_10k_paths(self, perf_tracker):
+        """Time is_video() over a filter-result-sized list of mostly stills."""
+        from utils.media_types import is_video
+
+        paths = [f"/photos/2024/trip/IMG_{i:05d}.JPG" for i in range(9_900)]
+        paths += [f"/photos/2024/trip/MVI_{i:05d}.MP4" for i in range(100)]
+
+        stats = _bench(lambda: [is_video(p) for p in paths], iterations=50)
+        perf_tracker.record("media_types.is_video_10k", stats)
+
+        print(f"\n  is_video x10k: {stats['mean_ms']:.3f} ms mean")
+        assert stats["mean_ms"] < 50
+
+
+class TestStatusEventPerformance:
+    """Benchmarks for the status-bar event published per settled hover."""
+
+    def test_publish_filepath_status_1k(self, perf_tracker):
+        """Time building and publishing 1k FILEPATH status events."""
+        from core.event_system import (
+            EventSystem, EventType, StatusMessageEventData, StatusSection,
+        )
+
+        events = EventSystem()
+        events.subscribe(EventType.STATUS_MESSAGE, lambda _: None)
+
+        def publish_1k():
+            for i in range(1_000):
+                events.publish(StatusMessageEventData(
+                    event_type=EventType.STATUS_MESSAGE,
+                    source="main_window",
+                    timestamp=time.time(),
+                    message=f"/photos/IMG_{i:05d}.JPG",
+                    section=StatusSection.FILEPATH,
+                ))
+
+        stats = _bench(publish_1k, iterations=50)
+        perf_tracker.record("event_system.publish_status_1k", stats)
+
+        print(f"\n  publish status x1k: {stats['mean_ms']:.3f} ms mean")
+        assert stats["mean_ms"] < 50
@@ -71,15 +71,16 @@ class TestLazyImports:
 
 
 class TestVideoExtensionsConstant:
-    """The inlined _VIDEO_EXTENSIONS in main_window must match the plugin's canonical list."""
+    """main_window and the video plugin share one video-extension list."""
 
     def test_matches_video_plugin(self):
         r = _run_import_check("""
-            from gui.main_window import _VIDEO_EXTENSIONS
+            import gui.main_window
             from plugins.video_plugin import VIDEO_EXTENSIONS
-            assert _VIDEO_EXTENSIONS == frozenset(VIDEO_EXTENSIONS), (
-                f"Mismatch: main_window has {_VIDEO_EXTENSIONS!r}, "
-                f"video_plugin has {frozenset(VIDEO_EXTENSIONS)!r}"
-            )
+            from utils import media_types
+            assert VIDEO_EXTENSIONS is media_types.VIDEO_EXTENSIONS
+            assert gui.main_window.is_video is media_types.is_video
+            assert media_types.is_video("/clips/A.MP4")
+            assert not media_types.is_video("/photos/a.jpg")
         """)
         assert r.returncode == 0, r.stderr
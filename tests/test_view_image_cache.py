@@ -0,0 +1,44 @@
+"""Tests for the client-side view-image byte cache."""
+from gui.view_image_cache import ViewImageCache
+
+
+class TestViewImageCache:
+    def test_get_miss(self):
+        assert ViewImageCache().get("/a.jpg") is None
+
+    def test_put_and_get(self):
+        cache = ViewImageCache()
+        cache.put("/a.jpg", b"abc")
+        assert cache.get("/a.jpg") == b"abc"
+        assert cache.size_bytes == 3
+
+    def test_evicts_least_recent_by_size(self):
+        cache = ViewImageCache(max_bytes=10)
+        cache.put("/a.jpg", b"x" * 4)
+        cache.put("/b.jpg", b"x" * 4)
+        cache.get("/a.jpg")  # /b.jpg is now least recent
+        cache.put("/c.jpg", b"x" * 4)
+
+        assert cache.get("/b.jpg") is None
+        assert cache.get("/a.jpg") is not None
+        assert cache.size_bytes == 8
+
+    def test_replace_updates_size(self):
+        cache = ViewImageCache()
+        cache.put("/a.jpg", b"x" * 5)
+        cache.put("/a.jpg", b"x" * 2)
+        assert cache.size_bytes == 2
+
+    def test_oversized_entry_is_not_stored(self):
+        cache = ViewImageCache(max_bytes=4)
+        cache.put("/a.jpg", b"x" * 5)
+        assert cache.get("/a.jpg") is None
+        assert cache.size_bytes == 0
+
+    def test_invalidate(self):
+        cache = ViewImageCache()
+        cache.put("/a.jpg", b"abc")
+        cache.invalidate("/a.jpg")
+        cache.invalidate("/missing.jpg")
+        assert cache.get("/a.jpg") is None
+        assert cache.size_bytes == 0
@@ -0,0 +1,18 @@
+"""File-type checks shared by the GUI and the video plugin.
+
+Import-light on purpose: gui.main_window uses it at startup, where pulling in
+plugins.video_plugin is deferred.
+"""
+
+VIDEO_EXTENSIONS = [
+    '.mp4', '.mov', '.mkv', '.avi', '.webm', '.m4v',
+    '.wmv', '.flv', '.mpg', '.mpeg', '.3gp', '.ts',
+]
+
+# why: str.endswith with a tuple scans in C; no splitext allocation per call.
+_VIDEO_SUFFIXES = tuple(VIDEO_EXTENSIONS)
+
+
+def is_video(path: str) -> bool:
+    """Return True if path has a video file extension (case-insensitive)."""
+    return path.lower().endswith(_VIDEO_SUFFIXES)